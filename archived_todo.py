@@ -0,0 +1,37 @@
+"""
+Cold storage for old completed todos.
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import JSON, Column, Index, Text
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+
+
+class ArchivedTodo(SQLModel, table=True):
+    """
+    A completed todo moved out of the todos table by the archive job.
+
+    Same columns as a todo, so archived rows serialize like live ones.
+    Keeping them apart leaves per-user scans of the hot table short.
+    """
+    __tablename__ = "archived_todos"
+    __table_args__ = (
+        Index("ix_archived_todos_user_created_id", "user_id", "created_at", "id"),
+    )
+
+    id: UUID = Field(primary_key=True, description="Original todo ID")
+    user_id: UUID = Field(description="Owner of the todo")
+    title: str = Field(max_length=255)
+    description: Optional[str] = Field(None, sa_column=Column(Text))
+    completed: bool = Field(default=True)
+    due_at: Optional[datetime] = None
+    remind_at: Optional[datetime] = None
+    tags: List[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON, nullable=False, server_default="[]")
+    )
+    version: int = Field(default=1)
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
@@ -3,13 +3,21 @@ Chat API routes for conversational todo management.
 """
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.database import get_session
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 from app.services import chat_service, conversation_service
+from app.services.idempotency import (
+    IdempotencyError,
+    IdempotencyKeyInProgress,
+    request_fingerprint,
+    run_idempotent,
+)
 
 
 router = APIRouter()
@@ -91,6 +99,8 @@ class ErrorResponse(BaseModel):
 async def chat(
     user_id: UUID,
     request: ChatRequest,
+    http_request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -105,6 +115,9 @@ async def chat(
     **Stateless Design**: Server reconstructs full conversation context from database on every request.
 
     **Authentication**: Requires valid JWT token. User ID in token must match user_id in path.
+
+    **Idempotency**: With an Idempotency-Key header, a retried request gets the
+    first response back instead of running the agent (and its tools) again.
     """
     # Verify user_id matches authenticated user
     if current_user.id != user_id:
@@ -132,53 +145,74 @@ async def chat(
                 }
             )
 
-    # Process message with AI agent
-    result = await chat_service.process_message(
-        session=session,
-        user_id=user_id,
-        message=request.message,
-        conversation_id=conversation_uuid
-    )
+    async def respond() -> JSONResponse:
+        # Process message with AI agent
+        result = await chat_service.process_message(
+            session=session,
+            user_id=user_id,
+            message=request.message,
+            conversation_id=conversation_uuid
+        )
 
-    # Handle errors
-    if not result.get("success"):
-        error_message = result.get("error", "An unexpected error occurred")
+        # Handle errors
+        if not result.get("success"):
+            error_message = result.get("error", "An unexpected error occurred")
 
-        # Determine appropriate status code
-        if "not found" in error_message.lower() or "access denied" in error_message.lower():
-            status_code = status.HTTP_404_NOT_FOUND
-            error_code = "NOT_FOUND"
-        else:
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-            error_code = "INTERNAL_ERROR"
+            # Determine appropriate status code
+            if "not found" in error_message.lower() or "access denied" in error_message.lower():
+                status_code = status.HTTP_404_NOT_FOUND
+                error_code = "NOT_FOUND"
+            else:
+                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                error_code = "INTERNAL_ERROR"
 
+            raise HTTPException(
+                status_code=status_code,
+                detail={
+                    "code": error_code,
+                    "message": error_message,
+                    "details": {}
+                }
+            )
+
+        # Return successful response
+        return JSONResponse(content=jsonable_encoder(ChatResponse(
+            success=True,
+            data=ChatResponseData(
+                conversation_id=result["conversation_id"],
+                response=result["response"],
+                tool_calls=[
+                    ToolCall(
+                        tool=tc["tool"],
+                        arguments=tc["arguments"],
+                        result=tc["result"]
+                    )
+                    for tc in result.get("tool_calls", [])
+                ]
+            ),
+            message="Message processed successfully"
+        )))
+
+    if idempotency_key is None:
+        return await respond()
+
+    fingerprint = request_fingerprint("POST", http_request.url.path, request.model_dump_json())
+    try:
+        return await run_idempotent(current_user.id, idempotency_key, fingerprint, respond)
+    except IdempotencyError as e:
         raise HTTPException(
-            status_code=status_code,
+            status_code=(
+                status.HTTP_409_CONFLICT
+                if isinstance(e, IdempotencyKeyInProgress)
+                else status.HTTP_422_UNPROCESSABLE_ENTITY
+            ),
             detail={
-                "code": error_code,
-                "message": error_message,
-                "details": {}
+                "code": e.code,
+                "message": str(e),
+                "details": {"idempotency_key": idempotency_key}
             }
         )
 
-    # Return successful response
-    return ChatResponse(
-        success=True,
-        data=ChatResponseData(
-            conversation_id=result["conversation_id"],
-            response=result["response"],
-            tool_calls=[
-                ToolCall(
-                    tool=tc["tool"],
-                    arguments=tc["arguments"],
-                    result=tc["result"]
-                )
-                for tc in result.get("tool_calls", [])
-            ]
-        ),
-        message="Message processed successfully"
-    )
-
 
 @router.get(
     "/{user_id}/conversations",
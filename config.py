@@ -3,6 +3,7 @@ Configuration module for loading environment variables.
 """
 import os
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 
@@ -16,6 +17,15 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
+    JWT_CODEC: Literal["jose", "pyjwt", "hs256"] = "jose"
+    JWT_VERIFY_CACHE_MAX_ENTRIES: int = 10_000  # 0 disables the verified-token cache
+
+    # Authenticated User Cache Configuration
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10_000
+    # Build the user from token claims instead of loading it (deleted users
+    # keep access until their token expires)
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
 
     # Server Configuration
     HOST: str = "0.0.0.0"
@@ -27,6 +37,47 @@ class Settings(BaseSettings):
     OPENAI_MAX_TOKENS: int = 1000
     OPENAI_TEMPERATURE: float = 0.7
 
+    # Todo Read Cache Configuration
+    TODO_CACHE_BACKEND: Literal["memory", "redis", "local"] = "memory"
+    TODO_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    TODO_CACHE_TTL_SECONDS: int = 60
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Idempotency-Key Configuration
+    IDEMPOTENCY_TTL_HOURS: int = 24
+    IDEMPOTENCY_CLAIM_LEASE_SECONDS: int = 60  # claims not renewed for this long are taken over
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 1000
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: int = 3600
+
+    # Soft-Deleted Todo Purge Configuration
+    TODO_PURGE_RETENTION_HOURS: int = 24
+    TODO_PURGE_BATCH_SIZE: int = 500
+    TODO_PURGE_BATCH_PAUSE_SECONDS: float = 0.1
+    TODO_PURGE_INTERVAL_SECONDS: int = 300
+
+    # Completed Todo Archive Configuration
+    TODO_ARCHIVE_AFTER_DAYS: int = 30
+    TODO_ARCHIVE_BATCH_SIZE: int = 500
+    TODO_ARCHIVE_INTERVAL_SECONDS: int = 3600
+
+    # Todo Table Partitioning (PostgreSQL hash partitions on user_id, 0 = off)
+    TODO_PARTITIONS: int = 0
+
+    # Todo Reminder Scheduler Configuration
+    TODO_REMINDER_WINDOW_SECONDS: int = 60
+    TODO_REMINDER_LEASE_SECONDS: int = 30
+
+    # Password Hashing Configuration (existing hashes are upgraded on login)
+    PASSWORD_HASH_ALGORITHM: Literal["bcrypt", "argon2id"] = "bcrypt"
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_KIB: int = 64 * 1024
+    PASSWORD_ARGON2_PARALLELISM: int = 1
+
+    # Password Hashing Pool Configuration
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -6,8 +6,22 @@ from urllib.parse import urlparse, parse_qs, urlencode
 from sqlmodel import SQLModel, create_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
+from app.models import todo_change  # noqa: F401 - registers change-tracking tables
+from app.models import user_todo_stats  # noqa: F401 - registers todo counter tables
+from app.models import idempotency_record  # noqa: F401 - registers idempotency table
+from app.models import archived_todo  # noqa: F401 - registers the todo archive table
+from app.models import scheduler_lease  # noqa: F401 - registers background job leases
+from app.models import todo_tag  # noqa: F401 - registers the todo tag table
+from app.models.todo_table import (
+    add_missing_todo_columns,
+    create_partitioned_todos_table,
+    create_todo_indexes,
+)
+from app.services.todo_search import install_search_ddl
 
 
 settings = get_settings()
@@ -75,7 +89,11 @@ async def init_db():
     Creates all tables defined in SQLModel metadata.
     """
     async with engine.begin() as conn:
+        await conn.run_sync(create_partitioned_todos_table, settings.TODO_PARTITIONS)
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(add_missing_todo_columns)
+        await conn.run_sync(create_todo_indexes)
+        await conn.run_sync(install_search_ddl)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -85,3 +103,14 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session_maker() as session:
         yield session
+
+
+def dialect_insert(session: AsyncSession):
+    """
+    Return the INSERT construct for the session's dialect.
+
+    Both the PostgreSQL and SQLite variants support ON CONFLICT upserts.
+    """
+    if session.bind.dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
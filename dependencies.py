@@ -7,11 +7,16 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from uuid import UUID
 from typing import Optional
+from app.config import get_settings
 from app.database import get_session
 from app.auth.jwt import verify_token
+from app.auth.user_cache import get_user_cache
 from app.models.user import User
 
 
+settings = get_settings()
+
+
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
@@ -23,6 +28,11 @@ async def get_current_user(
     """
     Dependency to get the current authenticated user from JWT token.
 
+    With AUTH_TRUST_TOKEN_CLAIMS the user is built from the signed token's
+    claims (id and email only) without touching the database. Otherwise
+    the user row is read through the in-process user cache, so the query
+    only runs on a cache miss.
+
     Args:
         credentials: HTTP Bearer token from Authorization header
         session: Database session
@@ -62,6 +72,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        # The token is signed by us, so its claims identify the user
+        return User(id=user_id, email=payload.get("email"))
+
+    cache = get_user_cache()
+    user = cache.get(user_id)
+    if user is not None:
+        return user
+
     # Fetch user from database
     result = await session.execute(
         select(User).where(User.id == user_id)
@@ -75,4 +94,5 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache.set(user)
     return user
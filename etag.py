@@ -0,0 +1,81 @@
+"""
+ETag helpers for conditional GET requests and If-Match preconditions.
+"""
+import hashlib
+from typing import Optional
+from uuid import UUID
+
+
+def make_etag(user_id: UUID, version: int, variant: str = "") -> str:
+    """
+    Build a weak ETag from a user's todo version.
+
+    Args:
+        user_id: Owner of the data
+        version: User's current todo change sequence
+        variant: Anything else that shapes the representation (e.g. the query string)
+
+    Returns:
+        Weak ETag header value
+    """
+    tag = f"{user_id}:{version}"
+    if variant:
+        digest = hashlib.sha1(variant.encode("utf-8")).hexdigest()[:12]
+        tag = f"{tag}:{digest}"
+    return f'W/"{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str, match_any: bool = True) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may list several tags)
+        etag: Current ETag of the resource
+        match_any: Whether "*" matches; pass False until the resource is
+            known to exist, since "*" only matches an existing representation
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return match_any
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    current = opaque(etag)
+    return any(opaque(candidate) == current for candidate in if_none_match.split(","))
+
+
+def parse_if_match_version(if_match: Optional[str]) -> Optional[int]:
+    """
+    Extract the expected todo version from an If-Match header.
+
+    If-Match takes the todo's own version (the "version" field of every
+    todo response) as a bare or quoted integer, e.g. 3 or "3". The weak
+    ETags of GET responses describe a whole user's data and are only for
+    If-None-Match. "*" matches any existing todo, i.e. sets no version.
+
+    Args:
+        if_match: Raw If-Match header value
+
+    Returns:
+        The expected version, or None if no header or "*" was sent
+
+    Raises:
+        ValueError: If the header does not carry a version number
+    """
+    if if_match is None:
+        return None
+
+    tag = if_match.strip()
+    if tag == "*":
+        return None
+    if tag.startswith("W/"):
+        raise ValueError("If-Match requires a strong validator")
+    return int(tag.strip('"'))
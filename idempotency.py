@@ -0,0 +1,421 @@
+"""
+Idempotency-Key support for POST endpoints.
+
+The first request with a given key claims it, runs, and stores its
+response in the idempotency_records table. Retries with the same key and
+payload get the stored response replayed instead of running again. A
+small in-process index in front of the table answers most replays
+without a database round trip.
+
+Claims and stored responses use their own short transactions, so they do
+not interfere with the commits made by the wrapped endpoint. A claim whose
+request is still running is renewed every third of
+IDEMPOTENCY_CLAIM_LEASE_SECONDS, so only a claim whose worker died is taken
+over by a retry. Each claim carries a token; a request that lost its claim
+anyway cannot overwrite or release the new holder's record. Expired records
+are deleted in batches by a background job.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Awaitable, Callable, NamedTuple, Optional, Tuple
+from uuid import UUID
+from fastapi import Response
+from sqlalchemy import delete, tuple_, update
+from sqlmodel import select
+from app.config import get_settings
+from app.database import async_session_maker, dialect_insert
+from app.models.idempotency_record import IdempotencyRecord
+from app.utils.periodic import PeriodicJob
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Completed responses kept in the in-process replay index
+MAX_INDEXED_RESPONSES = 10_000
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class StoredResponse(NamedTuple):
+    """A response recorded for an idempotency key."""
+    request_hash: str
+    status_code: int
+    body: str
+
+
+class IdempotencyError(Exception):
+    """Base class for requests that cannot use their Idempotency-Key."""
+    code = "IDEMPOTENCY_ERROR"
+
+
+class IdempotencyKeyInProgress(IdempotencyError):
+    """Another request with the same key has not finished yet."""
+    code = "REQUEST_IN_PROGRESS"
+
+
+class IdempotencyKeyReused(IdempotencyError):
+    """The key was already used for a request with a different payload."""
+    code = "IDEMPOTENCY_KEY_REUSED"
+
+
+class IdempotencyClaimLost(IdempotencyError):
+    """The request's claim was taken over before its response was stored."""
+    code = "IDEMPOTENCY_CLAIM_LOST"
+
+
+# (user_id, key) -> (stored response, monotonic expiry)
+_replay_index: "OrderedDict[Tuple[UUID, str], Tuple[StoredResponse, float]]" = OrderedDict()
+
+
+def request_fingerprint(method: str, path: str, body: str) -> str:
+    """
+    Hash the parts of a request that must match for a replay.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        body: Canonical request body
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(f"{method} {path}\n{body}".encode("utf-8")).hexdigest()
+
+
+def _index_get(user_id: UUID, key: str) -> Optional[StoredResponse]:
+    entry = _replay_index.get((user_id, key))
+    if entry is None:
+        return None
+    stored, expires_at = entry
+    if expires_at <= time.monotonic():
+        del _replay_index[(user_id, key)]
+        return None
+    _replay_index.move_to_end((user_id, key))
+    return stored
+
+
+def _index_put(user_id: UUID, key: str, stored: StoredResponse, ttl_seconds: float) -> None:
+    _replay_index[(user_id, key)] = (stored, time.monotonic() + ttl_seconds)
+    _replay_index.move_to_end((user_id, key))
+    while len(_replay_index) > MAX_INDEXED_RESPONSES:
+        _replay_index.popitem(last=False)
+
+
+def _check_stored(stored: StoredResponse, request_hash: str) -> StoredResponse:
+    if stored.request_hash != request_hash:
+        raise IdempotencyKeyReused("Idempotency-Key was already used with a different request")
+    return stored
+
+
+async def claim_idempotency_key(
+    user_id: UUID,
+    key: str,
+    request_hash: str,
+    claim_token: str
+) -> Optional[StoredResponse]:
+    """
+    Claim a key for a new request, or return the response to replay.
+
+    Args:
+        user_id: UUID of the requesting user
+        key: Idempotency-Key header value
+        request_hash: Fingerprint of the request
+        claim_token: Unique token identifying this request's claim
+
+    Returns:
+        None if the caller now owns the key and should run the request,
+        otherwise the stored response
+
+    Raises:
+        IdempotencyKeyInProgress: If another request holds an unexpired claim
+        IdempotencyKeyReused: If the key belongs to a different request
+    """
+    stored = _index_get(user_id, key)
+    if stored is not None:
+        return _check_stored(stored, request_hash)
+
+    now = datetime.utcnow()
+    async with async_session_maker() as session:
+        insert = dialect_insert(session)
+        statement = insert(IdempotencyRecord).values(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            status_code=None,
+            response_body=None,
+            created_at=now,
+            claimed_at=now,
+            claim_token=claim_token,
+            expires_at=now + timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+        )
+        # Expired records and abandoned claims are taken over as if they
+        # never existed
+        abandoned_before = now - timedelta(seconds=settings.IDEMPOTENCY_CLAIM_LEASE_SECONDS)
+        statement = statement.on_conflict_do_update(
+            index_elements=[IdempotencyRecord.user_id, IdempotencyRecord.key],
+            set_={
+                "request_hash": statement.excluded.request_hash,
+                "status_code": None,
+                "response_body": None,
+                "created_at": statement.excluded.created_at,
+                "claimed_at": statement.excluded.claimed_at,
+                "claim_token": statement.excluded.claim_token,
+                "expires_at": statement.excluded.expires_at,
+            },
+            where=(IdempotencyRecord.expires_at < now) | (
+                IdempotencyRecord.status_code.is_(None)
+                & (IdempotencyRecord.claimed_at < abandoned_before)
+            )
+        ).returning(IdempotencyRecord.key)
+        claimed = (await session.execute(statement)).first() is not None
+        await session.commit()
+
+        if claimed:
+            return None
+
+        result = await session.execute(
+            select(IdempotencyRecord)
+            .where(IdempotencyRecord.user_id == user_id)
+            .where(IdempotencyRecord.key == key)
+        )
+        record = result.scalar_one()
+
+    if record.status_code is None:
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyReused("Idempotency-Key was already used with a different request")
+        raise IdempotencyKeyInProgress("A request with this Idempotency-Key is still in progress")
+
+    stored = StoredResponse(record.request_hash, record.status_code, record.response_body)
+    ttl_seconds = (record.expires_at - datetime.utcnow()).total_seconds()
+    _index_put(user_id, key, stored, ttl_seconds)
+    return _check_stored(stored, request_hash)
+
+
+async def store_idempotent_response(
+    user_id: UUID,
+    key: str,
+    request_hash: str,
+    claim_token: str,
+    status_code: int,
+    body: str
+) -> None:
+    """
+    Record the response of a request that claimed a key.
+
+    Args:
+        user_id: UUID of the requesting user
+        key: Idempotency-Key header value
+        request_hash: Fingerprint of the request
+        claim_token: Token the claim was taken with
+        status_code: Response status code
+        body: Response body (JSON text)
+
+    Raises:
+        IdempotencyClaimLost: If the claim no longer carries claim_token
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.user_id == user_id)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.status_code.is_(None))
+            .where(IdempotencyRecord.claim_token == claim_token)
+            .values(status_code=status_code, response_body=body)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+    if result.rowcount == 0:
+        raise IdempotencyClaimLost("Idempotency-Key claim was taken over by another request")
+
+    stored = StoredResponse(request_hash, status_code, body)
+    _index_put(user_id, key, stored, settings.IDEMPOTENCY_TTL_HOURS * 3600)
+
+
+async def renew_idempotency_claim(user_id: UUID, key: str, claim_token: str) -> bool:
+    """
+    Push back the lease of a claim whose request is still running.
+
+    Args:
+        user_id: UUID of the requesting user
+        key: Idempotency-Key header value
+        claim_token: Token the claim was taken with
+
+    Returns:
+        False if the claim was taken over or finished in the meantime
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.user_id == user_id)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.status_code.is_(None))
+            .where(IdempotencyRecord.claim_token == claim_token)
+            .values(claimed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+    return result.rowcount > 0
+
+
+async def release_idempotency_key(user_id: UUID, key: str, claim_token: str) -> None:
+    """
+    Drop an unfinished claim so a retry can run the request again.
+
+    Args:
+        user_id: UUID of the requesting user
+        key: Idempotency-Key header value
+        claim_token: Token the claim was taken with
+    """
+    async with async_session_maker() as session:
+        await session.execute(
+            delete(IdempotencyRecord)
+            .where(IdempotencyRecord.user_id == user_id)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.status_code.is_(None))
+            .where(IdempotencyRecord.claim_token == claim_token)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
+async def _keep_claim(user_id: UUID, key: str, claim_token: str) -> None:
+    """Renew a claim until cancelled, so long requests keep their key."""
+    interval = settings.IDEMPOTENCY_CLAIM_LEASE_SECONDS / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await renew_idempotency_claim(user_id, key, claim_token):
+                logger.warning("Idempotency-Key claim for user %s was lost", user_id)
+                return
+        except Exception:
+            logger.exception("Failed to renew Idempotency-Key claim for user %s", user_id)
+
+
+async def _stop_keeping_claim(keeper: "asyncio.Task[None]") -> None:
+    keeper.cancel()
+    await asyncio.gather(keeper, return_exceptions=True)
+
+
+async def run_idempotent(
+    user_id: UUID,
+    key: str,
+    request_hash: str,
+    produce: Callable[[], Awaitable[Response]]
+) -> Response:
+    """
+    Run a request at most once per Idempotency-Key.
+
+    Responses below 500 are stored and replayed to retries. Server errors
+    and exceptions release the key so the client can retry for real. The
+    claim is renewed while produce() runs, however long that takes.
+
+    Args:
+        user_id: UUID of the requesting user
+        key: Idempotency-Key header value
+        request_hash: Fingerprint of the request
+        produce: Coroutine function producing the JSON response
+
+    Returns:
+        The fresh or replayed response
+
+    Raises:
+        IdempotencyKeyInProgress: If another request holds the key
+        IdempotencyKeyReused: If the key belongs to a different request
+    """
+    claim_token = uuid.uuid4().hex
+    stored = await claim_idempotency_key(user_id, key, request_hash, claim_token)
+    if stored is not None:
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"}
+        )
+
+    keeper = asyncio.create_task(_keep_claim(user_id, key, claim_token))
+    try:
+        response = await produce()
+    except BaseException:
+        await _stop_keeping_claim(keeper)
+        await release_idempotency_key(user_id, key, claim_token)
+        raise
+    await _stop_keeping_claim(keeper)
+
+    if response.status_code >= 500:
+        await release_idempotency_key(user_id, key, claim_token)
+        return response
+
+    try:
+        await store_idempotent_response(
+            user_id, key, request_hash, claim_token,
+            response.status_code, response.body.decode("utf-8")
+        )
+    except IdempotencyClaimLost:
+        # The work is done; answer this client even though retries will
+        # replay the new holder's response instead
+        logger.warning("Response for Idempotency-Key of user %s was not stored: claim lost", user_id)
+    return response
+
+
+async def purge_expired_idempotency_records(batch_size: Optional[int] = None) -> int:
+    """
+    Delete idempotency records whose expires_at has passed.
+
+    Each batch is its own short transaction, like the todo purge.
+
+    Args:
+        batch_size: Records per transaction (default from settings)
+
+    Returns:
+        Number of records deleted
+    """
+    if batch_size is None:
+        batch_size = settings.IDEMPOTENCY_PURGE_BATCH_SIZE
+
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(IdempotencyRecord.user_id, IdempotencyRecord.key)
+                .where(IdempotencyRecord.expires_at < datetime.utcnow())
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            keys = [tuple(row) for row in result.all()]
+            if keys:
+                await session.execute(
+                    delete(IdempotencyRecord)
+                    .where(tuple_(IdempotencyRecord.user_id, IdempotencyRecord.key).in_(keys))
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+
+        total += len(keys)
+        if len(keys) < batch_size:
+            return total
+        await asyncio.sleep(0)
+
+
+async def _purge_job() -> None:
+    removed = await purge_expired_idempotency_records()
+    if removed:
+        logger.info("Purged %d expired idempotency records", removed)
+
+
+@lru_cache()
+def get_idempotency_purger() -> PeriodicJob:
+    """
+    Get this worker's expired idempotency record purge job (created once per process).
+    """
+    return PeriodicJob(
+        "idempotency-purge", settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS, _purge_job
+    )
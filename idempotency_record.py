@@ -0,0 +1,29 @@
+"""
+Stored responses for Idempotency-Key replay.
+"""
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from uuid import UUID
+from typing import Optional
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """
+    First response produced for a (user, Idempotency-Key) pair.
+
+    A record without status_code is a claim held by a request still in
+    progress; its holder renews claimed_at while it runs, and a claim not
+    renewed within the claim lease is treated as abandoned.
+    Records stop counting once expires_at has passed and are then purged.
+    """
+    __tablename__ = "idempotency_records"
+
+    user_id: UUID = Field(primary_key=True, description="User who sent the request")
+    key: str = Field(primary_key=True, max_length=255, description="Client-supplied Idempotency-Key")
+    request_hash: str = Field(max_length=64, description="SHA-256 of method, path and body")
+    status_code: Optional[int] = Field(None, description="Stored response status (None while in progress)")
+    response_body: Optional[str] = Field(None, description="Stored JSON response body")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    claimed_at: datetime = Field(default_factory=datetime.utcnow, description="When the current claim was last taken or renewed")
+    claim_token: Optional[str] = Field(None, max_length=32, description="Token of the request holding the claim")
+    expires_at: datetime = Field(index=True, description="When the record may be replaced or purged")
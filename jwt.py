@@ -1,15 +1,212 @@
 """
 JWT token creation and verification utilities.
+
+verify_token() keeps recently verified tokens in a bounded LRU keyed by
+the token's SHA-256 digest (the token itself is never stored), so the
+bursts of requests a page load sends with one token decode and verify it
+once. Entries are only served until the token's exp.
+
+Encoding and decoding go through a JWTCodec chosen by JWT_CODEC:
+
+    jose   - python-jose (default)
+    pyjwt  - PyJWT
+    hs256  - built-in HS256 on hmac + base64 with the key and header
+             precomputed; HS256 only, no third-party code on the hot path
+
+All three produce and accept the same tokens, so the codec can be switched
+without logging anyone out. jwt_benchmark compares their throughput.
 """
+import base64
+import binascii
+import calendar
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from uuid import UUID
 from app.config import get_settings
 
 
 settings = get_settings()
 
+JWT_CODECS = ("jose", "pyjwt", "hs256")
+
+# Registered claims given as datetimes are encoded as NumericDate seconds
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+class InvalidTokenError(Exception):
+    """Raised by a codec for a malformed, forged or expired token."""
+
+
+class JWTCodec(ABC):
+    """Interface for JWT encode/decode backends."""
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims into a compact JWT."""
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token and return its claims.
+
+        Raises:
+            InvalidTokenError: If the signature, format, exp or nbf is invalid
+        """
+
+
+class JoseCodec(JWTCodec):
+    """python-jose backend."""
+
+    def __init__(self, secret: str, algorithm: str):
+        from jose import jwt
+
+        self._jwt = jwt
+        self.secret = secret
+        self.algorithm = algorithm
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self.secret, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        from jose import JWTError
+
+        try:
+            return self._jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+class PyJWTCodec(JWTCodec):
+    """PyJWT backend."""
+
+    def __init__(self, secret: str, algorithm: str):
+        # Optional dependency: only needed when JWT_CODEC is pyjwt
+        import jwt
+
+        self._jwt = jwt
+        self.secret = secret
+        self.algorithm = algorithm
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self.secret, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HS256Codec(JWTCodec):
+    """
+    Minimal HS256 backend on the standard library.
+
+    The HMAC key schedule is computed once and copied per token, and the
+    header segment is encoded once, so a token costs one HMAC and one JSON
+    round trip. Tokens whose header names any other algorithm are rejected.
+    """
+
+    def __init__(self, secret: str):
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header = _b64encode(json.dumps(
+            {"alg": "HS256", "typ": "JWT"}, separators=(",", ":")
+        ).encode("utf-8"))
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        claims = dict(claims)
+        for name in _TIME_CLAIMS:
+            if isinstance(claims.get(name), datetime):
+                claims[name] = calendar.timegm(claims[name].utctimetuple())
+
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            if header_segment.encode("ascii") != self._header:
+                header = json.loads(_b64decode(header_segment))
+                if not isinstance(header, dict) or header.get("alg") != "HS256":
+                    raise InvalidTokenError("Unsupported algorithm")
+
+            signing_input = f"{header_segment}.{payload_segment}".encode("ascii")
+            signature = _b64decode(signature_segment)
+            if not hmac.compare_digest(signature, self._sign(signing_input)):
+                raise InvalidTokenError("Signature verification failed")
+
+            claims = json.loads(_b64decode(payload_segment))
+        except (ValueError, UnicodeError, binascii.Error) as e:
+            raise InvalidTokenError("Malformed token") from e
+
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("Invalid payload")
+
+        now = time.time()
+        for name in _TIME_CLAIMS:
+            value = claims.get(name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise InvalidTokenError(f"Invalid {name} claim")
+        if "exp" in claims and claims["exp"] < now:
+            raise InvalidTokenError("Signature has expired")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise InvalidTokenError("The token is not yet valid")
+        return claims
+
+
+def make_jwt_codec(name: str, secret: str, algorithm: str = "HS256") -> JWTCodec:
+    """
+    Build a codec by name.
+
+    Args:
+        name: jose, pyjwt or hs256
+        secret: Signing secret
+        algorithm: JWT algorithm (hs256 supports only HS256)
+
+    Returns:
+        The codec
+
+    Raises:
+        ValueError: If the name is unknown or hs256 is paired with another algorithm
+    """
+    if name == "jose":
+        return JoseCodec(secret, algorithm)
+    if name == "pyjwt":
+        return PyJWTCodec(secret, algorithm)
+    if name == "hs256":
+        if algorithm != "HS256":
+            raise ValueError("The hs256 codec requires JWT_ALGORITHM=HS256")
+        return HS256Codec(secret)
+    raise ValueError(f"JWT_CODEC must be one of {', '.join(JWT_CODECS)}")
+
+
+@lru_cache()
+def get_jwt_codec() -> JWTCodec:
+    """
+    Get the configured JWT codec (created once per process).
+    """
+    return make_jwt_codec(settings.JWT_CODEC, settings.JWT_SECRET, settings.JWT_ALGORITHM)
+
 
 def create_access_token(user_id: UUID, email: str) -> str:
     """
@@ -32,15 +229,71 @@ def create_access_token(user_id: UUID, email: str) -> str:
         "iat": datetime.utcnow()  # Issued at
     }
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET,
-        algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = get_jwt_codec().encode(to_encode)
 
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    """LRU of decoded payloads of verified tokens, each held until its exp."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached payload, or None on a miss."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a verified payload; tokens without a numeric exp are not cached."""
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        self._entries[key] = (dict(payload), float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of the cache's size and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Forget every verified token (e.g. after rotating JWT_SECRET)."""
+        self._entries.clear()
+
+
+@lru_cache()
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """
+    Get this worker's verified-token cache (created once per process).
+    """
+    return VerifiedTokenCache(settings.JWT_VERIFY_CACHE_MAX_ENTRIES)
+
+
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify and decode a JWT token.
@@ -51,12 +304,15 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     Returns:
         Decoded token payload if valid, None if invalid
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+    cache = get_verified_token_cache()
+    payload = cache.get(token)
+    if payload is not None:
         return payload
-    except JWTError:
+
+    try:
+        payload = get_jwt_codec().decode(token)
+    except InvalidTokenError:
         return None
+
+    cache.set(token, payload)
+    return payload
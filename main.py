@@ -1,10 +1,18 @@
 """
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.database import init_db
+from app.services.todo_events import get_todo_event_listener
+from app.services.todo_purge import get_todo_purger
+from app.services.idempotency import get_idempotency_purger
+from app.services.todo_archive import get_todo_archiver
+from app.services.todo_reminders import get_reminder_scheduler
+from app.auth.jwt import get_verified_token_cache
+from app.auth.password import PasswordHasherBusy, get_password_hasher
 from app.config import get_settings
 
 
@@ -18,8 +26,29 @@ async def lifespan(app: FastAPI):
     """
     # Startup: Initialize database tables
     await init_db()
+    # Receive todo change events from all workers
+    listener = get_todo_event_listener()
+    listener.start()
+    # Remove soft-deleted todos in small batches
+    purger = get_todo_purger()
+    purger.start()
+    # Drop expired Idempotency-Key records
+    idempotency_purger = get_idempotency_purger()
+    idempotency_purger.start()
+    # Move old completed todos out of the hot table
+    archiver = get_todo_archiver()
+    archiver.start()
+    # Fire due reminders (one worker at a time holds the lease)
+    reminders = get_reminder_scheduler()
+    reminders.start()
     yield
     # Shutdown: Cleanup (if needed)
+    await reminders.stop()
+    await archiver.stop()
+    await idempotency_purger.stop()
+    await purger.stop()
+    await listener.stop()
+    get_password_hasher().shutdown()
 
 
 # Create FastAPI application
@@ -45,9 +74,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # Let browser clients send conditional GETs
 )
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed sign-up/sign-in load while the password hashing queue is full."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "success": False,
+            "error": {
+                "code": "SERVICE_BUSY",
+                "message": "Too many sign-in requests, please retry shortly"
+            }
+        },
+        headers={"Retry-After": "1"}
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information."""
@@ -63,7 +109,11 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "password_hashing": get_password_hasher().metrics(),
+        "verified_token_cache": get_verified_token_cache().metrics()
+    }
 
 
 # Register routers
@@ -0,0 +1,69 @@
+"""
+Opaque cursor helpers for keyset pagination.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional
+
+
+# Page size limits for cursor-paginated list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    Args:
+        position: JSON-serializable mapping describing the last row of a page
+
+    Returns:
+        Base64url-encoded cursor without padding
+    """
+    raw = json.dumps(position, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+
+    Returns:
+        The keyset position mapping
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if not isinstance(position, dict):
+        raise ValueError("Malformed cursor")
+
+    return position
+
+
+def page_info(limit: int, next_cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the pagination block attached to list responses.
+
+    Args:
+        limit: Requested page size
+        next_cursor: Cursor for the following page, or None on the last page
+
+    Returns:
+        Dict with limit, next_cursor and has_more
+    """
+    return {
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
@@ -1,22 +1,69 @@
 """
-Password hashing and verification utilities using bcrypt.
+Password hashing and verification utilities using bcrypt or argon2id.
+
+New hashes use PASSWORD_HASH_ALGORITHM with the configured cost. Stored
+hashes are verified with whichever algorithm produced them, and
+needs_rehash() reports hashes made with other settings so sign-in can
+replace them (verify_and_rehash()), migrating users lazily as they log in.
+
+Hashing takes hundreds of milliseconds per call by design, so async code
+uses the *_async() variants, which run it on a small dedicated thread pool
+(bcrypt and argon2 release the GIL) instead of the event loop. Once
+PASSWORD_HASH_MAX_QUEUE calls are already waiting for a worker, further
+calls fail fast with PasswordHasherBusy, which the app answers with 503,
+rather than queueing logins for seconds.
 """
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 import bcrypt
+from app.config import get_settings
+
+
+T = TypeVar("T")
+
+PASSWORD_ALGORITHMS = ("bcrypt", "argon2id")
+
+_ARGON2_PREFIX = "$argon2"
+
+
+@lru_cache()
+def _argon2_hasher():
+    # Optional dependency: only needed when argon2id hashes are made or stored
+    from argon2 import PasswordHasher as Argon2Hasher, Type
+
+    settings = get_settings()
+    return Argon2Hasher(
+        time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+        parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        type=Type.ID
+    )
+
+
+def _hash_algorithm() -> str:
+    # Settings only accept one of PASSWORD_ALGORITHMS
+    return get_settings().PASSWORD_HASH_ALGORITHM
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a plain-text password using bcrypt.
+    Hash a plain-text password with the configured algorithm and cost.
 
     Args:
         password: Plain-text password to hash
 
     Returns:
-        Bcrypt-hashed password string
+        Hashed password string (bcrypt or argon2id encoded)
     """
+    if _hash_algorithm() == "argon2id":
+        return _argon2_hasher().hash(password)
+
     # Convert password to bytes and hash it
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=get_settings().PASSWORD_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     # Return as string for database storage
     return hashed.decode('utf-8')
@@ -28,12 +75,219 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Args:
         plain_password: Plain-text password to verify
-        hashed_password: Bcrypt-hashed password to compare against
+        hashed_password: Stored bcrypt or argon2id hash to compare against
 
     Returns:
         True if password matches, False otherwise
     """
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        from argon2.exceptions import InvalidHashError, VerificationError
+
+        try:
+            return _argon2_hasher().verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
     # Convert both to bytes for bcrypt
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash was made with other than the current settings.
+
+    Args:
+        hashed_password: Stored bcrypt or argon2id hash
+
+    Returns:
+        True if the hash should be replaced on the next successful login
+    """
+    algorithm = _hash_algorithm()
+    if hashed_password.startswith(_ARGON2_PREFIX):
+        return algorithm != "argon2id" or _argon2_hasher().check_needs_rehash(hashed_password)
+    if algorithm != "bcrypt":
+        return True
+
+    # bcrypt hashes look like $2b$<rounds>$<salt+digest>
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != get_settings().PASSWORD_BCRYPT_ROUNDS
+
+
+def verify_and_rehash(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if it matches an outdated hash, hash it again.
+
+    Args:
+        plain_password: Plain-text password to verify
+        hashed_password: Stored hash to compare against
+
+    Returns:
+        (matches, new hash to store or None if the stored one is current)
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHasher:
+    """
+    Bounded executor for password hashing calls, with queue-wait and hash-time metrics.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+        self.max_hash_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing call on the pool.
+
+        Args:
+            func: Blocking function to run
+            *args: Arguments for func
+
+        Returns:
+            func's return value
+
+        Raises:
+            PasswordHasherBusy: If the queue is already full
+        """
+        if self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+
+        submitted = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def timed() -> T:
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                timings["wait"] = started - submitted
+                timings["hash"] = time.perf_counter() - started
+
+        loop = asyncio.get_running_loop()
+
+        def finished(future: "Future[T]") -> None:
+            # Runs when the call leaves the pool, not when the awaiting task
+            # is cancelled, so a cancelled login still counts until its hash ends
+            loop.call_soon_threadsafe(self._record, timings)
+
+        future = self._executor.submit(timed)
+        self._pending += 1
+        future.add_done_callback(finished)
+        return await asyncio.wrap_future(future)
+
+    def _record(self, timings: Dict[str, float]) -> None:
+        self._pending -= 1
+        if timings:
+            self.completed += 1
+            self.queue_wait_seconds += timings["wait"]
+            self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, timings["wait"])
+            self.hash_seconds += timings["hash"]
+            self.max_hash_seconds = max(self.max_hash_seconds, timings["hash"])
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the pool's counters.
+
+        Returns:
+            Dict with pending, completed and rejected counts and average /
+            maximum queue wait and hash time in seconds
+        """
+        completed = self.completed or 1
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_queue_wait_seconds": self.queue_wait_seconds / completed,
+            "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            "avg_hash_seconds": self.hash_seconds / completed,
+            "max_hash_seconds": self.max_hash_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        self._executor.shutdown(wait=True)
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """
+    Get this worker's password hashing pool (created once per process).
+    """
+    settings = get_settings()
+    return PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a plain-text password without blocking the event loop.
+
+    Args:
+        password: Plain-text password to hash
+
+    Returns:
+        Hashed password string
+
+    Raises:
+        PasswordHasherBusy: If the hashing queue is full
+    """
+    return await get_password_hasher().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain-text password without blocking the event loop.
+
+    Args:
+        plain_password: Plain-text password to verify
+        hashed_password: Stored hash to compare against
+
+    Returns:
+        True if password matches, False otherwise
+
+    Raises:
+        PasswordHasherBusy: If the hashing queue is full
+    """
+    return await get_password_hasher().run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_rehash_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    verify_and_rehash() without blocking the event loop.
+
+    Verification and any rehash share one pool slot.
+
+    Args:
+        plain_password: Plain-text password to verify
+        hashed_password: Stored hash to compare against
+
+    Returns:
+        (matches, new hash to store or None if the stored one is current)
+
+    Raises:
+        PasswordHasherBusy: If the hashing queue is full
+    """
+    return await get_password_hasher().run(verify_and_rehash, plain_password, hashed_password)
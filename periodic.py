@@ -0,0 +1,51 @@
+"""
+Periodic background jobs run inside each worker's event loop.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Runs a coroutine function every interval until stopped.
+
+    Failures are logged and retried on the next run, so one bad run never
+    kills the job.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, run: Callable[[], Awaitable[None]]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.run = run
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = asyncio.Event()
+
+    async def _loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                await self.run()
+            except Exception:
+                logger.exception("Periodic job %s failed", self.name)
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start running the job in the background."""
+        if self._task is not None:
+            return
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop after the current run finishes."""
+        if self._task is None:
+            return
+        self._stopped.set()
+        await self._task
+        self._task = None
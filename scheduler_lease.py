@@ -0,0 +1,19 @@
+"""
+Leases that let one worker at a time run a cluster-wide background job.
+"""
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class SchedulerLease(SQLModel, table=True):
+    """
+    Current holder of a named job.
+
+    The holder renews expires_at while it runs; once the lease has expired
+    any other worker may take it over.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name: str = Field(primary_key=True, max_length=100, description="Job name")
+    owner: str = Field(max_length=100, description="Worker holding the lease")
+    expires_at: datetime = Field(description="When the lease lapses unless renewed")
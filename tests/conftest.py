@@ -0,0 +1,85 @@
+"""
+Shared test fixtures.
+
+Tests that touch the database run against a throwaway SQLite file unless
+DATABASE_URL is already set (e.g. to a PostgreSQL test database).
+"""
+import asyncio
+import os
+import tempfile
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+)
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+
+class FakeClock:
+    """Stand-in for time.monotonic(); tests move it by changing now."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Freeze time.monotonic() for TTL tests of the in-process caches."""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+def run_db(coroutine):
+    """Run a coroutine that uses the app engine in a fresh event loop."""
+    from app.database import engine
+
+    async def wrapper():
+        try:
+            return await coroutine
+        finally:
+            # Pooled connections belong to this loop
+            await engine.dispose()
+
+    return asyncio.run(wrapper())
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Create the schema once per test session."""
+    from app.database import init_db
+
+    run_db(init_db())
+
+
+def _create_user() -> UUID:
+    from app.database import async_session_maker
+    from app.models.user import User
+
+    async def create() -> UUID:
+        async with async_session_maker() as session:
+            user = User(id=uuid4(), email=f"{uuid4().hex}@example.com", password_hash="x")
+            session.add(user)
+            await session.commit()
+            return user.id
+
+    return run_db(create())
+
+
+@pytest.fixture
+def user_id(database) -> UUID:
+    """A freshly created user with no todos."""
+    return _create_user()
+
+
+@pytest.fixture
+def other_user_id(database) -> UUID:
+    """A second user, for checking that writes stay scoped to their owner."""
+    return _create_user()
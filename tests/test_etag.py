@@ -0,0 +1,52 @@
+"""
+Tests for the ETag helpers.
+"""
+from uuid import uuid4
+
+import pytest
+
+from app.utils.etag import etag_matches, make_etag, parse_if_match_version
+
+
+def test_etag_is_weak_and_varies_with_version_and_variant():
+    user_id = uuid4()
+
+    etag = make_etag(user_id, 3, "/todos?limit=10")
+
+    assert etag.startswith('W/"')
+    assert etag != make_etag(user_id, 4, "/todos?limit=10")
+    assert etag != make_etag(user_id, 3, "/todos?limit=20")
+
+
+def test_etag_matches_weakly_in_a_list():
+    etag = make_etag(uuid4(), 1)
+    strong = etag[2:]
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {strong}', etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_wildcard_only_matches_when_allowed():
+    etag = make_etag(uuid4(), 1)
+
+    assert etag_matches("*", etag)
+    assert not etag_matches("*", etag, match_any=False)
+
+
+@pytest.mark.parametrize("header, version", [
+    (None, None),
+    ("3", 3),
+    ('"3"', 3),
+    (' "12" ', 12),
+    ("*", None),
+])
+def test_if_match_version(header, version):
+    assert parse_if_match_version(header) == version
+
+
+@pytest.mark.parametrize("header", ['W/"3"', '"abc"', ""])
+def test_if_match_without_a_strong_version_is_rejected(header):
+    with pytest.raises(ValueError):
+        parse_if_match_version(header)
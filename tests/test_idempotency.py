@@ -0,0 +1,102 @@
+"""
+Tests for Idempotency-Key claim, replay and release.
+"""
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy import update
+
+from app.database import async_session_maker
+from app.models.idempotency_record import IdempotencyRecord
+from app.services.idempotency import (
+    REPLAYED_HEADER,
+    IdempotencyClaimLost,
+    IdempotencyKeyReused,
+    claim_idempotency_key,
+    request_fingerprint,
+    run_idempotent,
+    store_idempotent_response,
+)
+from tests.conftest import run_db
+
+
+class Handler:
+    """Counts how often the wrapped request really runs."""
+
+    def __init__(self, status_code: int = 201):
+        self.status_code = status_code
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return JSONResponse({"call": self.calls}, status_code=self.status_code)
+
+
+REQUEST = request_fingerprint("POST", "/todos", '{"title":"a"}')
+
+
+def test_retry_replays_the_stored_response(user_id):
+    handler = Handler()
+    key = uuid4().hex
+
+    first = run_db(run_idempotent(user_id, key, REQUEST, handler))
+    retry = run_db(run_idempotent(user_id, key, REQUEST, handler))
+
+    assert handler.calls == 1
+    assert (retry.status_code, retry.body) == (201, first.body)
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert REPLAYED_HEADER not in first.headers
+
+
+def test_key_reused_for_another_request_is_rejected(user_id):
+    key = uuid4().hex
+    run_db(run_idempotent(user_id, key, REQUEST, Handler()))
+
+    other = request_fingerprint("POST", "/todos", '{"title":"b"}')
+    with pytest.raises(IdempotencyKeyReused):
+        run_db(run_idempotent(user_id, key, other, Handler()))
+
+
+def test_server_error_releases_the_key(user_id):
+    key = uuid4().hex
+    failing, handler = Handler(status_code=503), Handler()
+
+    run_db(run_idempotent(user_id, key, REQUEST, failing))
+    retry = run_db(run_idempotent(user_id, key, REQUEST, handler))
+
+    assert (failing.calls, handler.calls) == (1, 1)
+    assert retry.status_code == 201 and REPLAYED_HEADER not in retry.headers
+
+
+def test_exception_releases_the_key(user_id):
+    key = uuid4().hex
+
+    async def explode():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        run_db(run_idempotent(user_id, key, REQUEST, explode))
+
+    handler = Handler()
+    run_db(run_idempotent(user_id, key, REQUEST, handler))
+    assert handler.calls == 1
+
+
+def test_store_fails_once_the_claim_was_taken_over(user_id):
+    key = uuid4().hex
+
+    async def claim_then_lose():
+        await claim_idempotency_key(user_id, key, REQUEST, "mine")
+        async with async_session_maker() as session:
+            await session.execute(
+                update(IdempotencyRecord)
+                .where(IdempotencyRecord.user_id == user_id)
+                .where(IdempotencyRecord.key == key)
+                .values(claim_token="theirs")
+            )
+            await session.commit()
+        await store_idempotent_response(user_id, key, REQUEST, "mine", 201, "{}")
+
+    with pytest.raises(IdempotencyClaimLost):
+        run_db(claim_then_lose())
@@ -0,0 +1,115 @@
+"""
+Tests for the JWT codecs.
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.auth import jwt as jwt_module
+from app.auth.jwt import HS256Codec, InvalidTokenError, JWTCodec, make_jwt_codec
+
+
+SECRET = "test-secret"
+
+
+def segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def claims(**overrides):
+    values = {
+        "sub": "4f1c2b9e-0000-4000-8000-000000000000",
+        "email": "user@example.com",
+        "exp": datetime.utcnow() + timedelta(hours=1),
+        "iat": datetime.utcnow(),
+    }
+    values.update(overrides)
+    return values
+
+
+def test_codec_interface_is_abstract():
+    with pytest.raises(TypeError):
+        JWTCodec()
+
+
+def test_hs256_round_trip():
+    codec = HS256Codec(SECRET)
+
+    decoded = codec.decode(codec.encode(claims()))
+
+    assert decoded["sub"] == claims()["sub"]
+    assert isinstance(decoded["exp"], int)
+
+
+def test_hs256_rejects_tampered_payload():
+    codec = HS256Codec(SECRET)
+    header, _, signature = codec.encode(claims()).split(".")
+    forged = f"{header}.{segment({'sub': 'someone-else', 'exp': 9_999_999_999})}.{signature}"
+
+    with pytest.raises(InvalidTokenError):
+        codec.decode(forged)
+
+
+def test_hs256_rejects_other_secret():
+    token = HS256Codec("other-secret").encode(claims())
+
+    with pytest.raises(InvalidTokenError):
+        HS256Codec(SECRET).decode(token)
+
+
+def test_hs256_rejects_other_algorithms():
+    codec = HS256Codec(SECRET)
+    _, payload, signature = codec.encode(claims()).split(".")
+
+    with pytest.raises(InvalidTokenError):
+        codec.decode(f"{segment({'alg': 'none'})}.{payload}.{signature}")
+
+
+def test_hs256_rejects_expired_tokens():
+    codec = HS256Codec(SECRET)
+    token = codec.encode(claims(exp=datetime.utcnow() - timedelta(seconds=1)))
+
+    with pytest.raises(InvalidTokenError):
+        codec.decode(token)
+
+
+def test_hs256_rejects_tokens_not_yet_valid():
+    codec = HS256Codec(SECRET)
+    token = codec.encode(claims(nbf=datetime.utcnow() + timedelta(hours=1)))
+
+    with pytest.raises(InvalidTokenError):
+        codec.decode(token)
+
+
+@pytest.mark.parametrize("token", ["", "a.b", "a.b.c.d", "!!.??.**"])
+def test_hs256_rejects_malformed_tokens(token):
+    with pytest.raises(InvalidTokenError):
+        HS256Codec(SECRET).decode(token)
+
+
+@pytest.mark.parametrize("name", ["jose", "pyjwt"])
+def test_hs256_tokens_interoperate_with_libraries(name):
+    try:
+        library = make_jwt_codec(name, SECRET)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    fast = HS256Codec(SECRET)
+
+    assert library.decode(fast.encode(claims()))["sub"] == claims()["sub"]
+    assert fast.decode(library.encode(claims()))["sub"] == claims()["sub"]
+
+
+def test_make_jwt_codec_validates_arguments():
+    with pytest.raises(ValueError):
+        make_jwt_codec("hs256", SECRET, "HS512")
+    with pytest.raises(ValueError):
+        make_jwt_codec("unknown", SECRET)
+
+
+def test_verify_token_maps_invalid_tokens_to_none(monkeypatch):
+    monkeypatch.setattr(jwt_module, "get_jwt_codec", lambda: HS256Codec(SECRET))
+    jwt_module.get_verified_token_cache().clear()
+
+    assert jwt_module.verify_token("not-a-token") is None
@@ -0,0 +1,51 @@
+"""
+Tests for the keyset pagination cursor helpers.
+"""
+import base64
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor, page_info
+
+
+def test_cursor_round_trip():
+    position = {"created_at": "2026-01-02T03:04:05.123456", "id": "5f0c6f3e-9a3b-4e0b-9b53-0d6c1c1f2a10"}
+
+    assert decode_cursor(encode_cursor(position)) == position
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor({"title": "??>>~~", "id": "x"})
+
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+def test_cursor_serializes_non_json_values_as_strings():
+    from datetime import datetime
+
+    cursor = encode_cursor({"created_at": datetime(2026, 1, 2, 3, 4, 5)})
+
+    assert decode_cursor(cursor) == {"created_at": "2026-01-02 03:04:05"}
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"{broken json").decode().rstrip("="),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode().rstrip("="),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_cursor_must_decode_to_an_object():
+    cursor = base64.urlsafe_b64encode(b"[1, 2]").decode().rstrip("=")
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_page_info():
+    assert page_info(50, "abc") == {"limit": 50, "next_cursor": "abc", "has_more": True}
+    assert page_info(50, None) == {"limit": 50, "next_cursor": None, "has_more": False}
@@ -0,0 +1,59 @@
+"""
+Tests for the bounded password hashing pool.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.auth.password import PasswordHasher, PasswordHasherBusy
+
+
+def test_cancelled_call_counts_as_pending_until_the_hash_finishes():
+    hasher = PasswordHasher(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario():
+        task = asyncio.ensure_future(hasher.run(release.wait))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        # The worker thread is still hashing, so the pool is still full
+        pending_after_cancel = hasher.metrics()["pending"]
+        with pytest.raises(PasswordHasherBusy):
+            await asyncio.wait_for(hasher.run(lambda: None), timeout=1)
+
+        release.set()
+        for _ in range(100):
+            if hasher.metrics()["pending"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        return pending_after_cancel
+
+    try:
+        pending_after_cancel = asyncio.run(scenario())
+    finally:
+        release.set()
+        hasher.shutdown()
+
+    assert pending_after_cancel == 1
+    assert hasher.metrics()["pending"] == 0
+    assert hasher.completed == 1
+    assert hasher.rejected == 1
+
+
+def test_run_returns_the_result_and_records_timings():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+
+    async def scenario():
+        return await hasher.run(lambda value: value * 2, 21)
+
+    try:
+        result = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert result == 42
+    metrics = hasher.metrics()
+    assert metrics["pending"] == 0 and metrics["completed"] == 1
@@ -0,0 +1,100 @@
+"""
+Tests for the in-process todo read caches.
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.services.todo_cache import (
+    LocalRedis,
+    MemoryTodoCache,
+    RedisTodoCache,
+    TodoCacheBackend,
+    todo_cache_key,
+)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        TodoCacheBackend()
+
+
+def test_memory_cache_hit_and_miss(clock):
+    cache = MemoryTodoCache(max_bytes=1024, ttl_seconds=60)
+    user_id = uuid4()
+
+    assert run(cache.get(user_id, "a")) is None
+    run(cache.set(user_id, "a", b"payload"))
+
+    assert run(cache.get(user_id, "a")) == b"payload"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_cache_entries_expire(clock):
+    cache = MemoryTodoCache(max_bytes=1024, ttl_seconds=60)
+    user_id = uuid4()
+    run(cache.set(user_id, "a", b"payload"))
+
+    clock.now += 61
+
+    assert run(cache.get(user_id, "a")) is None
+
+
+def test_memory_cache_evicts_least_recently_used(clock):
+    # Each entry is 1-byte key + 9-byte value = 10 bytes
+    cache = MemoryTodoCache(max_bytes=25, ttl_seconds=60)
+    user_id = uuid4()
+    run(cache.set(user_id, "a", b"x" * 9))
+    run(cache.set(user_id, "b", b"x" * 9))
+    run(cache.get(user_id, "a"))
+
+    run(cache.set(user_id, "c", b"x" * 9))
+
+    assert run(cache.get(user_id, "b")) is None
+    assert run(cache.get(user_id, "a")) is not None
+    assert run(cache.get(user_id, "c")) is not None
+
+
+def test_memory_cache_skips_entries_larger_than_the_budget(clock):
+    cache = MemoryTodoCache(max_bytes=10, ttl_seconds=60)
+    user_id = uuid4()
+
+    run(cache.set(user_id, "a", b"x" * 100))
+
+    assert run(cache.get(user_id, "a")) is None
+
+
+def test_memory_cache_invalidates_only_that_user(clock):
+    cache = MemoryTodoCache(max_bytes=1024, ttl_seconds=60)
+    alice, bob = uuid4(), uuid4()
+    run(cache.set(alice, "a1", b"1"))
+    run(cache.set(alice, "a2", b"2"))
+    run(cache.set(bob, "b1", b"3"))
+
+    run(cache.invalidate_user(alice))
+
+    assert run(cache.get(alice, "a1")) is None
+    assert run(cache.get(alice, "a2")) is None
+    assert run(cache.get(bob, "b1")) == b"3"
+
+
+def test_redis_cache_on_local_stand_in(clock):
+    cache = RedisTodoCache(LocalRedis(), ttl_seconds=60)
+    user_id = uuid4()
+    run(cache.set(user_id, "a", b"payload"))
+
+    assert run(cache.get(user_id, "a")) == b"payload"
+
+    clock.now += 61
+    assert run(cache.get(user_id, "a")) is None
+
+
+def test_cache_key_is_scoped_to_the_user():
+    user_id = uuid4()
+
+    assert todo_cache_key(user_id, 'W/"v1"') == f'{user_id}:W/"v1"'
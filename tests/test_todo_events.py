@@ -0,0 +1,202 @@
+"""
+Tests for todo change events: delivery after commit, and the LISTEN loop
+feeding the event hub.
+
+The LISTEN tests stub the database connection: each FakeDriver stands in
+for one asyncpg connection handed out by the engine.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.database import async_session_maker, engine
+from app.schemas.todo import TodoCreate
+from app.services import todo_events
+from app.services.todo_events import (
+    NOTIFY_CHANNEL,
+    TodoEventHub,
+    TodoEventListener,
+    get_todo_event_hub,
+)
+from app.services.todo_service import insert_todos
+from tests.conftest import run_db
+
+
+local_delivery = pytest.mark.skipif(
+    engine.dialect.name == "postgresql",
+    reason="PostgreSQL delivers events through LISTEN/NOTIFY"
+)
+
+
+async def _write_and_watch(user_id, commit: bool):
+    """Insert a todo, returning (events seen before commit/rollback, events after, todo)."""
+    hub = get_todo_event_hub()
+    queue = hub.subscribe(user_id)
+    try:
+        async with async_session_maker() as session:
+            todos = await insert_todos(session, user_id, [TodoCreate(title="watched")])
+            before = queue.qsize()
+            if commit:
+                await session.commit()
+            else:
+                await session.rollback()
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        return before, events, todos[0]
+    finally:
+        hub.unsubscribe(user_id, queue)
+
+
+@local_delivery
+def test_write_event_is_delivered_after_commit(user_id):
+    before, events, todo = run_db(_write_and_watch(user_id, commit=True))
+
+    assert before == 0
+    assert [event["type"] for event in events] == ["changed"]
+    assert events[0]["user_id"] == str(user_id)
+    assert events[0]["todo_ids"] == [str(todo["id"])]
+
+
+@local_delivery
+def test_rolled_back_write_publishes_nothing(user_id):
+    before, events, _ = run_db(_write_and_watch(user_id, commit=False))
+
+    assert (before, events) == (0, [])
+
+
+class FakeDriver:
+    def __init__(self, healthy: bool = True):
+        self.healthy = healthy
+        self.listeners = []
+        self.termination_listeners = []
+        self.health_checks = 0
+
+    async def add_listener(self, channel, callback):
+        self.listeners.append(callback)
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.remove(callback)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    async def execute(self, query):
+        self.health_checks += 1
+        if not self.healthy:
+            raise ConnectionError("connection reset")
+
+    def notify(self, payload):
+        for callback in list(self.listeners):
+            callback(self, 1, NOTIFY_CHANNEL, json.dumps(payload))
+
+    def terminate(self):
+        for callback in list(self.termination_listeners):
+            callback(self)
+
+
+class FakeConnection:
+    def __init__(self, driver: FakeDriver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self.driver)
+
+
+class FakeEngine:
+    dialect = SimpleNamespace(name="postgresql")
+
+    def __init__(self, *drivers: FakeDriver):
+        self.drivers = list(drivers)
+        self.connects = 0
+
+    def connect(self):
+        driver = self.drivers[self.connects]
+        self.connects += 1
+        return FakeConnection(driver)
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.fixture
+def fast_reconnect(monkeypatch):
+    monkeypatch.setattr(todo_events, "RECONNECT_DELAY_SECONDS", 0.001)
+    monkeypatch.setattr(todo_events, "LISTEN_HEALTH_CHECK_SECONDS", 0.01)
+
+
+def test_listener_reconnects_when_the_connection_is_closed(monkeypatch, fast_reconnect):
+    first, second = FakeDriver(), FakeDriver()
+    monkeypatch.setattr(todo_events, "engine", FakeEngine(first, second))
+    user_id = uuid4()
+
+    async def scenario():
+        hub = TodoEventHub()
+        queue = hub.subscribe(user_id)
+        listener = TodoEventListener(hub)
+        listener.start()
+
+        await _until(lambda: first.listeners)
+        first.terminate()
+        await _until(lambda: second.listeners)
+
+        second.notify({"type": "changed", "user_id": str(user_id)})
+        event = queue.get_nowait()
+        await listener.stop()
+        return event
+
+    event = asyncio.run(scenario())
+
+    assert event["type"] == "changed"
+    assert first.listeners == [] and first.termination_listeners == []
+    assert second.listeners == [] and second.termination_listeners == []
+
+
+def test_listener_reconnects_when_the_health_check_fails(monkeypatch, fast_reconnect):
+    first, second = FakeDriver(healthy=False), FakeDriver()
+    fake_engine = FakeEngine(first, second)
+    monkeypatch.setattr(todo_events, "engine", fake_engine)
+
+    async def scenario():
+        listener = TodoEventListener(TodoEventHub())
+        listener.start()
+        await _until(lambda: second.health_checks > 0)
+        await listener.stop()
+
+    asyncio.run(scenario())
+
+    assert first.health_checks == 1
+    assert fake_engine.connects == 2
+    assert first.listeners == [] and second.listeners == []
+
+
+def test_stop_releases_a_healthy_connection(monkeypatch, fast_reconnect):
+    driver = FakeDriver()
+    fake_engine = FakeEngine(driver)
+    monkeypatch.setattr(todo_events, "engine", fake_engine)
+
+    async def scenario():
+        listener = TodoEventListener(TodoEventHub())
+        listener.start()
+        await _until(lambda: driver.health_checks >= 2)
+        await listener.stop()
+
+    asyncio.run(scenario())
+
+    assert fake_engine.connects == 1
+    assert driver.listeners == [] and driver.termination_listeners == []
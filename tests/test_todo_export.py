@@ -0,0 +1,64 @@
+"""
+Tests for the streaming todo export.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from app.database import async_session_maker
+from app.models.archived_todo import ArchivedTodo
+from app.schemas.todo import TodoCreate
+from app.services.todo_export import stream_todos_export
+from app.services.todo_service import insert_todos
+from tests.conftest import run_db
+
+
+async def _live_and_archived(user_id: UUID) -> None:
+    async with async_session_maker() as session:
+        await insert_todos(session, user_id, [TodoCreate(title="live")])
+        old = datetime.utcnow() - timedelta(days=400)
+        session.add(ArchivedTodo(
+            id=uuid4(), user_id=user_id, title="archived", completed=True,
+            created_at=old, updated_at=old
+        ))
+        await session.commit()
+
+
+async def _export(user_id: UUID, export_format: str, **options) -> str:
+    chunks = []
+    async for chunk in stream_todos_export(user_id, export_format, ["title", "completed"], **options):
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+def _titles(user_id: UUID, completed: Optional[bool] = None, **options) -> List[str]:
+    body = run_db(_export(user_id, "ndjson", completed=completed, **options))
+    return [json.loads(line)["title"] for line in body.splitlines()]
+
+
+def test_export_includes_archived_todos_after_live_ones(user_id):
+    run_db(_live_and_archived(user_id))
+
+    assert _titles(user_id) == ["live", "archived"]
+
+
+def test_export_can_leave_out_archived_todos(user_id):
+    run_db(_live_and_archived(user_id))
+
+    assert _titles(user_id, include_archived=False) == ["live"]
+
+
+def test_open_todo_export_skips_archived_todos(user_id):
+    run_db(_live_and_archived(user_id))
+
+    assert _titles(user_id, completed=False) == ["live"]
+    assert _titles(user_id, completed=True) == ["archived"]
+
+
+def test_csv_export_includes_archived_todos(user_id):
+    run_db(_live_and_archived(user_id))
+
+    body = run_db(_export(user_id, "csv"))
+
+    assert body.splitlines() == ["title,completed", "live,False", "archived,True"]
@@ -0,0 +1,61 @@
+"""
+Tests for bulk todo loading.
+
+These need a database: they run against DATABASE_URL and skip unless it
+points at PostgreSQL, where copy_todos uses COPY.
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.database import async_session_maker, engine, init_db
+from app.models.todo import Todo
+from app.models.user import User
+from app.schemas.todo import TodoCreate
+from app.services import todo_service
+
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="COPY path requires PostgreSQL"
+)
+
+
+async def _failed_chunk_leaves_no_rows(monkeypatch) -> int:
+    await init_db()
+    async with async_session_maker() as session:
+        user = User(id=uuid4(), email=f"{uuid4().hex}@example.com", password_hash="x")
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    async def fail_after_copy(*args, **kwargs):
+        raise RuntimeError("tag write failed")
+
+    monkeypatch.setattr(todo_service, "write_todo_tags", fail_after_copy)
+
+    async with async_session_maker() as session:
+        with pytest.raises(RuntimeError):
+            await todo_service.copy_todos(
+                session,
+                user_id,
+                [TodoCreate(title=f"todo {i}", tags=["x"]) for i in range(10)]
+            )
+        await session.rollback()
+
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(func.count()).select_from(Todo).where(Todo.user_id == user_id)
+        )
+        count = result.scalar_one()
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+    await engine.dispose()
+    return count
+
+
+def test_failed_copy_chunk_leaves_no_rows(monkeypatch):
+    assert asyncio.run(_failed_chunk_leaves_no_rows(monkeypatch)) == 0
@@ -0,0 +1,104 @@
+"""
+Tests for the incrementally maintained todo statistics.
+"""
+from uuid import UUID
+
+from app.database import async_session_maker
+from app.schemas.todo import TodoCreate
+from app.services.todo_service import copy_todos, delete_todo_rows, insert_todos, set_todos_completed
+from app.services.todo_stats import get_todo_stats
+from tests.conftest import run_db
+
+
+async def _stats(user_id: UUID):
+    async with async_session_maker() as session:
+        stats = await get_todo_stats(session, user_id, 7)
+        await session.commit()
+        return stats
+
+
+async def _import(user_id: UUID, count: int):
+    async with async_session_maker() as session:
+        todo_ids = await copy_todos(session, user_id, [TodoCreate(title=f"t{i}") for i in range(count)])
+        await session.commit()
+        return todo_ids
+
+
+def test_first_import_into_empty_account_is_counted(user_id):
+    run_db(_import(user_id, 3))
+
+    stats = run_db(_stats(user_id))
+
+    assert (stats["total"], stats["open"], stats["completed"]) == (3, 3, 0)
+    assert stats["created_recently"] == 3
+
+
+def test_import_then_crud_keeps_counts_in_step(user_id):
+    imported = run_db(_import(user_id, 3))
+
+    async def more_writes():
+        async with async_session_maker() as session:
+            await insert_todos(session, user_id, [TodoCreate(title="a"), TodoCreate(title="b")])
+            await set_todos_completed(session, user_id, imported[:1], True)
+            await session.commit()
+
+    run_db(more_writes())
+    stats = run_db(_stats(user_id))
+
+    assert (stats["total"], stats["open"], stats["completed"]) == (5, 4, 1)
+
+
+def test_stats_seeded_on_first_read_match_existing_todos(user_id):
+    run_db(_import(user_id, 2))
+
+    first = run_db(_stats(user_id))
+    second = run_db(_stats(user_id))
+
+    assert first == second
+    assert first["total"] == 2
+
+
+def test_completing_twice_counts_once(user_id):
+    todo_ids = run_db(_import(user_id, 2))
+
+    async def complete():
+        async with async_session_maker() as session:
+            await set_todos_completed(session, user_id, todo_ids[:1], True)
+            await session.commit()
+
+    run_db(complete())
+    run_db(complete())
+    stats = run_db(_stats(user_id))
+
+    assert (stats["total"], stats["open"], stats["completed"]) == (2, 1, 1)
+
+
+def test_deletes_leave_the_matching_counter(user_id):
+    todo_ids = run_db(_import(user_id, 3))
+
+    async def complete_then_delete():
+        async with async_session_maker() as session:
+            await set_todos_completed(session, user_id, todo_ids[:1], True)
+            await session.commit()
+        async with async_session_maker() as session:
+            await delete_todo_rows(session, user_id, todo_ids[:2])
+            await session.commit()
+
+    run_db(complete_then_delete())
+    stats = run_db(_stats(user_id))
+
+    assert (stats["total"], stats["open"], stats["completed"]) == (1, 1, 0)
+
+
+def test_rolled_back_write_leaves_counters_alone(user_id):
+    run_db(_import(user_id, 1))
+    before = run_db(_stats(user_id))
+
+    async def rolled_back():
+        async with async_session_maker() as session:
+            await insert_todos(session, user_id, [TodoCreate(title="never")])
+            await session.rollback()
+
+    run_db(rolled_back())
+
+    assert run_db(_stats(user_id)) == before
@@ -0,0 +1,97 @@
+"""
+Tests for the delta-sync change feed and the batch write operations that feed it.
+"""
+from uuid import UUID, uuid4
+
+from app.database import async_session_maker
+from app.schemas.todo import TodoCreate
+from app.services.todo_service import delete_todo_rows, insert_todos, set_todos_completed
+from app.services.todo_sync import get_todo_version, list_todo_changes
+from tests.conftest import run_db
+
+
+async def _create(user_id: UUID, count: int):
+    async with async_session_maker() as session:
+        todos = await insert_todos(session, user_id, [TodoCreate(title=f"t{i}") for i in range(count)])
+        await session.commit()
+        return [todo["id"] for todo in todos]
+
+
+async def _changes(user_id: UUID, since: int, limit: int = 100):
+    async with async_session_maker() as session:
+        return await list_todo_changes(session, user_id, since, limit)
+
+
+def test_feed_returns_created_todos_and_a_resume_cursor(user_id):
+    todo_ids = run_db(_create(user_id, 2))
+
+    changed, deleted, cursor, has_more = run_db(_changes(user_id, 0))
+
+    assert [todo["id"] for todo in changed] == todo_ids
+    assert deleted == [] and has_more is False
+    assert run_db(_changes(user_id, cursor)) == ([], [], cursor, False)
+
+
+def test_deleted_todo_becomes_a_tombstone(user_id):
+    todo_ids = run_db(_create(user_id, 2))
+    _, _, cursor, _ = run_db(_changes(user_id, 0))
+
+    async def delete_first():
+        async with async_session_maker() as session:
+            deleted = await delete_todo_rows(session, user_id, todo_ids[:1])
+            await session.commit()
+            return deleted
+
+    assert run_db(delete_first()) == todo_ids[:1]
+
+    # A client that already synced sees only the tombstone
+    changed, deleted, _, _ = run_db(_changes(user_id, cursor))
+    assert changed == [] and deleted == todo_ids[:1]
+
+    # A fresh client sees the survivor and the tombstone, not the deleted row
+    changed, deleted, _, _ = run_db(_changes(user_id, 0))
+    assert [todo["id"] for todo in changed] == todo_ids[1:]
+    assert deleted == todo_ids[:1]
+
+
+def test_feed_pages_with_has_more(user_id):
+    todo_ids = run_db(_create(user_id, 3))
+
+    first, _, cursor, has_more = run_db(_changes(user_id, 0, limit=2))
+    rest, _, _, more_after = run_db(_changes(user_id, cursor, limit=2))
+
+    assert has_more is True and more_after is False
+    assert [todo["id"] for todo in first + rest] == todo_ids
+
+
+def test_batch_complete_writes_only_changed_todos(user_id):
+    todo_ids = run_db(_create(user_id, 3))
+
+    async def complete(ids):
+        async with async_session_maker() as session:
+            todos = await set_todos_completed(session, user_id, ids, True)
+            await session.commit()
+            return todos, await get_todo_version(session, user_id)
+
+    _, version = run_db(complete(todo_ids[:2]))
+    todos, version_after = run_db(complete(todo_ids + [uuid4()]))
+
+    # Already-completed todos are returned but not written again; unknown ids are dropped
+    assert sorted(todo["id"] for todo in todos) == sorted(todo_ids)
+    assert all(todo["completed"] for todo in todos)
+    assert version_after == version + 1
+
+
+def test_batch_delete_skips_other_users_todos(user_id, other_user_id):
+    mine = run_db(_create(user_id, 1))
+    theirs = run_db(_create(other_user_id, 1))
+
+    async def delete_all():
+        async with async_session_maker() as session:
+            deleted = await delete_todo_rows(session, user_id, mine + theirs)
+            await session.commit()
+            return deleted
+
+    assert run_db(delete_all()) == mine
+    changed, deleted, _, _ = run_db(_changes(other_user_id, 0))
+    assert [todo["id"] for todo in changed] == theirs and deleted == []
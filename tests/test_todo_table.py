@@ -0,0 +1,39 @@
+"""
+DDL tests for the todos table.
+"""
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.schema import CreateTable
+
+from app.models.todo import Todo
+from app.models.todo_table import _copy_batch_statement, _partitioned_todo_table
+
+
+def test_partitioned_table_ddl_compiles_on_postgresql():
+    ddl = str(CreateTable(_partitioned_todo_table()).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY HASH (user_id)" in ddl
+    assert "PRIMARY KEY (id, user_id)" in ddl
+    for foreign_key in Todo.__table__.foreign_keys:
+        assert f"REFERENCES {foreign_key.column.table.name} ({foreign_key.column.name})" in ddl
+
+
+def test_partitioned_table_keeps_every_todo_column():
+    table = _partitioned_todo_table()
+
+    assert [column.name for column in table.columns] == [
+        column.name for column in Todo.__table__.columns
+    ]
+
+
+def test_copy_batch_statement_compiles_for_asyncpg():
+    for first_batch in (True, False):
+        compiled = _copy_batch_statement("todos", "todos_unpartitioned", first_batch).compile(
+            dialect=asyncpg.dialect()
+        )
+        sql = str(compiled)
+
+        assert "%(" not in sql
+        assert "$1" in sql
+        assert set(compiled.params) == ({"limit"} if first_batch else {"last_id", "limit"})
+        assert "INSERT INTO todos (" in sql and "FROM todos_unpartitioned" in sql
@@ -0,0 +1,71 @@
+"""
+Tests for tag normalization and the tag filter.
+"""
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlmodel import select
+
+from app.models.todo import Todo
+from app.schemas.todo import MAX_TAG_LENGTH, MAX_TAGS_PER_TODO, TodoCreate, TodoUpdate, normalize_tags
+from app.services.todo_queries import apply_tag_filter
+
+
+def test_tags_are_trimmed_lowercased_and_deduplicated():
+    assert normalize_tags([" Work", "work ", "URGENT", ""]) == ["work", "urgent"]
+
+
+def test_comma_separated_string_is_split():
+    assert normalize_tags("home, Errands,,home") == ["home", "errands"]
+
+
+def test_none_passes_through():
+    assert normalize_tags(None) is None
+
+
+def test_non_string_tag_is_rejected():
+    with pytest.raises(ValueError):
+        normalize_tags(["ok", 3])
+
+
+def test_tag_length_is_limited():
+    normalize_tags(["x" * MAX_TAG_LENGTH])
+    with pytest.raises(ValueError):
+        normalize_tags(["x" * (MAX_TAG_LENGTH + 1)])
+
+
+def test_tag_count_is_limited():
+    normalize_tags([f"t{i}" for i in range(MAX_TAGS_PER_TODO)])
+    with pytest.raises(ValueError):
+        normalize_tags([f"t{i}" for i in range(MAX_TAGS_PER_TODO + 1)])
+
+
+def test_schemas_normalize_tags():
+    assert TodoCreate(title="t", tags=["A", "a"]).tags == ["a"]
+    assert TodoCreate(title="t").tags == []
+    assert TodoUpdate().tags is None
+    with pytest.raises(ValidationError):
+        TodoCreate(title="t", tags=["x" * (MAX_TAG_LENGTH + 1)])
+
+
+def _compiled(match):
+    statement = apply_tag_filter(select(Todo.id), uuid4(), ["a", "b"], match)
+    return str(statement.compile(compile_kwargs={"literal_binds": False}))
+
+
+def test_any_filter_has_no_grouping():
+    sql = _compiled("any")
+
+    assert "todo_tags" in sql
+    assert "HAVING" not in sql
+
+
+def test_all_filter_requires_every_tag():
+    assert "HAVING count(todo_tags.tag) =" in _compiled("all")
+
+
+def test_empty_tag_filter_leaves_statement_alone():
+    statement = select(Todo.id)
+
+    assert apply_tag_filter(statement, uuid4(), [], "all") is statement
@@ -0,0 +1,68 @@
+"""
+Tests for the authenticated user cache.
+"""
+from uuid import uuid4
+
+from app.auth.user_cache import UserCache
+from app.models.user import User
+
+
+def make_user() -> User:
+    return User(id=uuid4(), email=f"{uuid4().hex}@example.com", password_hash="hash")
+
+
+def test_hit_returns_a_fresh_copy(clock):
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    user = make_user()
+    cache.set(user)
+
+    cached = cache.get(user.id)
+
+    assert cached is not user
+    assert (cached.id, cached.email) == (user.id, user.email)
+    assert cache.get(user.id) is not cached
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_miss_and_expiry(clock):
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    user = make_user()
+
+    assert cache.get(user.id) is None
+    cache.set(user)
+    clock.now += 61
+
+    assert cache.get(user.id) is None
+    assert cache.misses == 2
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    first, second, third = make_user(), make_user(), make_user()
+    cache.set(first)
+    cache.set(second)
+    cache.get(first.id)
+
+    cache.set(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) is not None
+    assert cache.get(third.id) is not None
+
+
+def test_invalidate(clock):
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    user = make_user()
+    cache.set(user)
+
+    cache.invalidate(user.id)
+
+    assert cache.get(user.id) is None
+
+
+def test_zero_entries_disables_the_cache(clock):
+    cache = UserCache(max_entries=0, ttl_seconds=60)
+    user = make_user()
+    cache.set(user)
+
+    assert cache.get(user.id) is None
@@ -0,0 +1,68 @@
+"""
+Tests for the verified-token cache.
+"""
+import pytest
+
+from app.auth import jwt as jwt_module
+from app.auth.jwt import VerifiedTokenCache
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(jwt_module.time, "time", lambda: clock["now"])
+    return clock
+
+
+def test_hit_until_exp(now):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.set("token", {"sub": "u", "exp": now["now"] + 60})
+
+    assert cache.get("token") == {"sub": "u", "exp": now["now"] + 60}
+
+    now["now"] += 61
+    assert cache.get("token") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_callers_get_copies(now):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.set("token", {"sub": "u", "exp": now["now"] + 60})
+
+    cache.get("token")["sub"] = "changed"
+
+    assert cache.get("token")["sub"] == "u"
+
+
+def test_tokens_are_not_stored_in_plaintext(now):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.set("secret.token.value", {"exp": now["now"] + 60})
+
+    assert "secret.token.value" not in cache._entries
+    assert all(isinstance(key, bytes) and len(key) == 32 for key in cache._entries)
+
+
+@pytest.mark.parametrize("payload", [{"sub": "u"}, {"exp": "soon"}])
+def test_tokens_without_numeric_exp_are_not_cached(now, payload):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.set("token", payload)
+
+    assert cache.get("token") is None
+
+
+def test_size_is_bounded(now):
+    cache = VerifiedTokenCache(max_entries=2)
+    for token in ("a", "b", "c"):
+        cache.set(token, {"exp": now["now"] + 60})
+
+    assert cache.get("a") is None
+    assert cache.metrics()["entries"] == 2
+
+
+def test_clear(now):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.set("token", {"exp": now["now"] + 60})
+
+    cache.clear()
+
+    assert cache.get("token") is None
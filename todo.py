@@ -1,22 +1,76 @@
 """
 Todo Pydantic schemas for request/response validation.
 """
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, BeforeValidator, Field
+from datetime import datetime, timezone
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Any, List, Optional
+
+
+# Limits for tags on a single todo
+MAX_TAGS_PER_TODO = 20
+MAX_TAG_LENGTH = 50
+
+
+def normalize_tags(value: Any) -> Any:
+    """Lowercase, trim and de-duplicate tags; accepts a comma-separated string."""
+    if value is None:
+        return value
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return value
+
+    tags = []
+    for tag in value:
+        if not isinstance(tag, str):
+            raise ValueError("Tags must be strings")
+        tag = tag.strip().lower()
+        if not tag:
+            continue
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Tags can be at most {MAX_TAG_LENGTH} characters")
+        if tag not in tags:
+            tags.append(tag)
+    if len(tags) > MAX_TAGS_PER_TODO:
+        raise ValueError(f"A todo can have at most {MAX_TAGS_PER_TODO} tags")
+    return tags
+
+
+def _naive_utc(value: Any) -> Any:
+    """Store timestamps as naive UTC, like every other column."""
+    if value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Optional timestamp stored as naive UTC ("" reads as no value)
+OptionalUtcDateTime = Annotated[Optional[datetime], BeforeValidator(_naive_utc)]
+
+# Tag list (or comma-separated string) normalized by normalize_tags
+TagList = Annotated[List[str], BeforeValidator(normalize_tags)]
 
 
 class TodoCreate(BaseModel):
     """Schema for creating a new todo."""
     title: str = Field(..., min_length=1, max_length=255, description="Todo title")
     description: Optional[str] = Field(None, description="Todo description (optional)")
+    due_at: OptionalUtcDateTime = Field(None, description="When the todo is due (optional)")
+    remind_at: OptionalUtcDateTime = Field(None, description="When to send a reminder (optional)")
+    tags: TagList = Field(default_factory=list, description="Tags (optional)")
 
 
 class TodoUpdate(BaseModel):
     """Schema for updating an existing todo."""
     title: Optional[str] = Field(None, min_length=1, max_length=255, description="Todo title")
     description: Optional[str] = Field(None, description="Todo description")
+    due_at: OptionalUtcDateTime = Field(None, description="When the todo is due (null clears it)")
+    remind_at: OptionalUtcDateTime = Field(None, description="When to send a reminder (null clears it)")
+    tags: Optional[TagList] = Field(None, description="Replacement tag list")
 
 
 class TodoResponse(BaseModel):
@@ -26,8 +80,31 @@ class TodoResponse(BaseModel):
     title: str
     description: Optional[str]
     completed: bool
+    due_at: Optional[datetime] = None
+    remind_at: Optional[datetime] = None
+    tags: List[str] = Field(default_factory=list)
+    version: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class TodoBatchUpdate(TodoUpdate):
+    """Schema for one update operation in a batch request."""
+    id: UUID = Field(..., description="ID of the todo to update")
+
+
+class TodoBatchComplete(BaseModel):
+    """Schema for one completion operation in a batch request."""
+    id: UUID = Field(..., description="ID of the todo to mark")
+    completed: bool = Field(True, description="Completion status to set")
+
+
+class TodoBatchRequest(BaseModel):
+    """Schema for a batch of todo operations applied in one transaction."""
+    create: List[TodoCreate] = Field(default_factory=list, description="Todos to create")
+    update: List[TodoBatchUpdate] = Field(default_factory=list, description="Todos to update")
+    complete: List[TodoBatchComplete] = Field(default_factory=list, description="Completion changes")
+    delete: List[UUID] = Field(default_factory=list, description="IDs of todos to delete")
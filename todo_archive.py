@@ -0,0 +1,149 @@
+"""
+Hot/cold tiering of completed todos.
+
+Todos completed (last changed) more than TODO_ARCHIVE_AFTER_DAYS ago are
+moved from the todos table into archived_todos by a background job. Reads
+of the todos table - list_todos, search, the chat tools - then only step
+over the hot set; the archive has its own paginated endpoint.
+
+To delta-sync and event subscribers an archived todo leaves the hot set
+like a deleted one: each is recorded as a tombstone in the change feed and
+announced with a "deleted" event, which also moves the user's version on
+so cached list pages holding the moved rows are not served again. The
+per-user counters still count archived todos and are left alone.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import DateTime, delete, insert, literal, true, tuple_
+from sqlmodel import select
+from app.config import get_settings
+from app.database import async_session_maker
+from app.models.todo import Todo
+from app.models.archived_todo import ArchivedTodo
+from app.models.todo_tag import TodoTag
+from app.services.todo_queries import TODO_FIELDS
+from app.services.todo_sync import record_todo_changes
+from app.services.todo_cache import get_todo_cache
+from app.services.todo_events import publish_todo_change
+from app.utils.periodic import PeriodicJob
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+async def archive_todos_batch(cutoff: datetime, batch_size: int) -> int:
+    """
+    Move one batch of todos completed before cutoff into the archive.
+
+    The copy and the delete run in one short transaction, so a todo is
+    always in exactly one of the two tables.
+
+    Args:
+        cutoff: Only completed todos last updated before this time are moved
+        batch_size: Maximum number of todos to move
+
+    Returns:
+        Number of todos moved
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Todo.id, Todo.user_id)
+            .where(Todo.completed == true())
+            .where(Todo.deleted_at.is_(None))
+            .where(Todo.updated_at < cutoff)
+            .order_by(Todo.updated_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        todo_ids = [row.id for row in rows]
+        ids_by_user: Dict[UUID, List[UUID]] = {}
+        for row in rows:
+            ids_by_user.setdefault(row.user_id, []).append(row.id)
+        # (user_id, id) pairs let a partitioned table prune to the right partitions
+        keys = [(row.user_id, row.id) for row in rows]
+
+        columns = list(TODO_FIELDS)
+        await session.execute(
+            insert(ArchivedTodo.__table__).from_select(
+                columns + ["archived_at"],
+                select(
+                    *(getattr(Todo, name) for name in columns),
+                    literal(datetime.utcnow(), DateTime)
+                ).where(tuple_(Todo.user_id, Todo.id).in_(keys))
+            )
+        )
+        await session.execute(
+            delete(Todo)
+            .where(tuple_(Todo.user_id, Todo.id).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+        # Archived todos keep their tags in the JSON column only
+        await session.execute(
+            delete(TodoTag)
+            .where(tuple_(TodoTag.user_id, TodoTag.todo_id).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+        # Lock version rows in a fixed order so concurrent archivers cannot deadlock
+        for user_id in sorted(ids_by_user):
+            version = await record_todo_changes(session, user_id, ids_by_user[user_id], deleted=True)
+            await publish_todo_change(session, user_id, version, ids_by_user[user_id], deleted=True)
+        await session.commit()
+
+    cache = get_todo_cache()
+    for user_id in ids_by_user:
+        await cache.invalidate_user(user_id)
+    return len(todo_ids)
+
+
+async def archive_completed_todos(
+    older_than: Optional[timedelta] = None,
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Move every completed todo older than the threshold into the archive.
+
+    Args:
+        older_than: Age since last update (default from settings)
+        batch_size: Todos per transaction (default from settings)
+
+    Returns:
+        Total number of todos moved
+    """
+    if older_than is None:
+        older_than = timedelta(days=settings.TODO_ARCHIVE_AFTER_DAYS)
+    if batch_size is None:
+        batch_size = settings.TODO_ARCHIVE_BATCH_SIZE
+
+    cutoff = datetime.utcnow() - older_than
+    total = 0
+    while True:
+        moved = await archive_todos_batch(cutoff, batch_size)
+        total += moved
+        if moved < batch_size:
+            return total
+        # Let foreground queries in between batches
+        await asyncio.sleep(0)
+
+
+async def _archive_job() -> None:
+    moved = await archive_completed_todos()
+    if moved:
+        logger.info("Archived %d completed todos", moved)
+
+
+@lru_cache()
+def get_todo_archiver() -> PeriodicJob:
+    """
+    Get this worker's archive job (created once per process).
+    """
+    return PeriodicJob("todo-archive", settings.TODO_ARCHIVE_INTERVAL_SECONDS, _archive_job)
@@ -0,0 +1,177 @@
+"""
+Read-through cache for serialized todo read responses.
+
+Entries are keyed by user, the user's todo version and the request shape,
+so any write (which bumps the version) makes older entries unreachable.
+Write paths also call invalidate_user() so the in-process backend frees
+their memory right away.
+
+Backends:
+    memory - in-process LRU bounded by total bytes, with a TTL (default)
+    redis  - shared Redis-protocol server for multi-worker deployments
+    local  - in-process stand-in speaking the same client API as redis,
+             for tests and single-process runs of the redis code path
+"""
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+from uuid import UUID
+from app.config import get_settings
+
+
+class TodoCacheBackend(ABC):
+    """Interface for todo read caches."""
+
+    @abstractmethod
+    async def get(self, user_id: UUID, key: str) -> Optional[bytes]:
+        """Return the cached payload for key, or None on a miss."""
+
+    @abstractmethod
+    async def set(self, user_id: UUID, key: str, value: bytes) -> None:
+        """Store a payload for key."""
+
+    @abstractmethod
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every entry belonging to a user."""
+
+
+class MemoryTodoCache(TodoCacheBackend):
+    """In-process LRU cache bounded by payload bytes, with a TTL per entry."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, float, UUID]]" = OrderedDict()
+        self._keys_by_user: Dict[UUID, Set[str]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _remove(self, key: str) -> None:
+        value, _, user_id = self._entries.pop(key)
+        self._size -= len(key) + len(value)
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+    async def get(self, user_id: UUID, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, user_id: UUID, key: str, value: bytes) -> None:
+        entry_size = len(key) + len(value)
+        if entry_size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        # Evict least recently used entries until the new one fits
+        while self._entries and self._size + entry_size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds, user_id)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        self._size += entry_size
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        for key in list(self._keys_by_user.get(user_id, ())):
+            self._remove(key)
+
+
+class RedisTodoCache(TodoCacheBackend):
+    """
+    Shared cache on a Redis-protocol server.
+
+    Stale versions are never read again and expire through their TTL, so
+    invalidation needs no key scans.
+    """
+
+    def __init__(self, client, ttl_seconds: float, prefix: str = "todo-read:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    async def get(self, user_id: UUID, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, user_id: UUID, key: str, value: bytes) -> None:
+        await self.client.set(self.prefix + key, value, px=int(self.ttl_seconds * 1000))
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        # Keys embed the user's version; a bumped version already misses
+        return None
+
+
+class LocalRedis:
+    """
+    Minimal in-process stand-in for the redis.asyncio client.
+
+    Implements only the get/set(px=)/delete calls used by RedisTodoCache.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, px: Optional[int] = None) -> bool:
+        expires_at = time.monotonic() + px / 1000 if px is not None else None
+        self._data[key] = (value, expires_at)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+
+def todo_cache_key(user_id: UUID, etag: str) -> str:
+    """
+    Build a cache key from the response's ETag.
+
+    The ETag already encodes the user's version and the request shape.
+    """
+    return f"{user_id}:{etag}"
+
+
+@lru_cache()
+def get_todo_cache() -> TodoCacheBackend:
+    """
+    Get the configured todo cache backend (created once per process).
+    """
+    settings = get_settings()
+    backend = settings.TODO_CACHE_BACKEND
+
+    if backend == "redis":
+        # Optional dependency: only needed when the redis backend is selected
+        import redis.asyncio as redis
+        client = redis.from_url(settings.REDIS_URL)
+        return RedisTodoCache(client, settings.TODO_CACHE_TTL_SECONDS)
+
+    if backend == "local":
+        return RedisTodoCache(LocalRedis(), settings.TODO_CACHE_TTL_SECONDS)
+
+    return MemoryTodoCache(settings.TODO_CACHE_MAX_BYTES, settings.TODO_CACHE_TTL_SECONDS)
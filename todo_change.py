@@ -0,0 +1,39 @@
+"""
+Change-tracking models for todo delta sync.
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from datetime import datetime
+from uuid import UUID
+
+
+class UserTodoVersion(SQLModel, table=True):
+    """
+    Per-user monotonic change sequence.
+
+    Every todo mutation increments the owning user's version in the same
+    transaction, so sequence numbers are assigned in commit order per user.
+    """
+    __tablename__ = "user_todo_versions"
+
+    user_id: UUID = Field(primary_key=True, description="Owner of the todos")
+    version: int = Field(default=0, description="Last assigned change sequence")
+
+
+class TodoChange(SQLModel, table=True):
+    """
+    Latest change recorded for each todo.
+
+    One row per todo: a newer change overwrites seq, so a feed read returns
+    each todo at most once. Deleted todos keep their row as a tombstone.
+    """
+    __tablename__ = "todo_changes"
+    __table_args__ = (
+        Index("ix_todo_changes_user_seq", "user_id", "seq", unique=True),
+    )
+
+    user_id: UUID = Field(primary_key=True, description="Owner of the todo")
+    todo_id: UUID = Field(primary_key=True, description="Changed todo")
+    seq: int = Field(description="User change sequence of the latest change")
+    deleted: bool = Field(default=False, description="True if the todo was deleted")
+    changed_at: datetime = Field(default_factory=datetime.utcnow)
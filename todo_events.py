@@ -0,0 +1,251 @@
+"""
+Real-time todo change events.
+
+_record_write() publishes an event for every todo write, from both the
+REST routes and the chat agent tools. Events are only delivered once the
+write's transaction commits:
+
+    postgresql - the event is sent with pg_notify() inside the write's
+                 transaction, which PostgreSQL delivers on commit. Each
+                 worker LISTENs on one connection and fans events out to
+                 its own subscribers, so every worker sees every write.
+    other      - a local broker stand-in: events wait in session.info and
+                 are handed to this worker's subscribers after commit.
+
+Events are notifications, not data: clients fetch the actual changes from
+the delta-sync feed with the cursor they already hold. The reminder
+scheduler publishes "reminder" events through the same path.
+"""
+import asyncio
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import engine
+from app.utils.pagination import encode_cursor
+
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "todo_changes"
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_BYTES = 7900
+
+# Events buffered per subscriber before it is told to resync instead
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# How often the idle LISTEN connection is probed, so a silently dropped
+# connection is replaced instead of leaving the worker deaf
+LISTEN_HEALTH_CHECK_SECONDS = 15.0
+
+# Backoff between LISTEN reconnect attempts
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+_PENDING_EVENTS_KEY = "pending_todo_events"
+
+
+class TodoEventHub:
+    """In-process fan-out of todo events to this worker's subscribers."""
+
+    def __init__(self):
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = {}
+
+    def subscribe(self, user_id: UUID) -> asyncio.Queue:
+        """Register a subscriber for a user's events."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: UUID, queue: asyncio.Queue) -> None:
+        """Remove a subscriber registered with subscribe()."""
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def publish(self, payload: Dict[str, Any]) -> None:
+        """
+        Deliver an event to every subscriber of its user.
+
+        A subscriber that falls behind loses its backlog and gets a single
+        resync event, so a slow client can never hold memory or block writers.
+        """
+        user_id = UUID(payload["user_id"])
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync", "user_id": payload["user_id"]})
+
+
+@lru_cache()
+def get_todo_event_hub() -> TodoEventHub:
+    """
+    Get this worker's event hub (created once per process).
+    """
+    return TodoEventHub()
+
+
+async def publish_todo_change(
+    session: AsyncSession,
+    user_id: UUID,
+    version: int,
+    todo_ids: List[UUID],
+    deleted: bool = False
+) -> None:
+    """
+    Publish a todo write once its transaction commits.
+
+    Args:
+        session: Database session (same transaction as the write)
+        user_id: UUID of the owning user
+        version: User's todo version after the write
+        todo_ids: UUIDs of the written todos
+        deleted: True if the todos were deleted
+    """
+    payload: Dict[str, Any] = {
+        "type": "deleted" if deleted else "changed",
+        "user_id": str(user_id),
+        "version": version,
+        "cursor": encode_cursor({"seq": version}),
+        "todo_ids": [str(todo_id) for todo_id in todo_ids],
+    }
+    await publish_todo_event(session, payload)
+
+
+async def publish_todo_event(session: AsyncSession, payload: Dict[str, Any]) -> None:
+    """
+    Publish an event to the owner's subscribers once the transaction commits.
+
+    Args:
+        session: Database session (same transaction as the change)
+        payload: JSON-serializable event with "type" and "user_id" keys
+    """
+    if session.bind.dialect.name != "postgresql":
+        session.info.setdefault(_PENDING_EVENTS_KEY, []).append(payload)
+        return
+
+    message = json.dumps(payload, separators=(",", ":"))
+    if len(message.encode("utf-8")) > MAX_NOTIFY_BYTES:
+        # Large batches only announce that something changed
+        payload["todo_ids"] = None
+        message = json.dumps(payload, separators=(",", ":"))
+    await session.execute(select(func.pg_notify(NOTIFY_CHANNEL, message)))
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending_events(session: Session) -> None:
+    events = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if events:
+        hub = get_todo_event_hub()
+        for payload in events:
+            hub.publish(payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+class TodoEventListener:
+    """Holds this worker's LISTEN connection and feeds the event hub."""
+
+    def __init__(self, hub: TodoEventHub):
+        self.hub = hub
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = asyncio.Event()
+
+    def _on_notify(self, connection, pid, channel, message) -> None:
+        try:
+            self.hub.publish(json.loads(message))
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed todo event: %r", message)
+
+    async def _hold(self, driver) -> None:
+        """
+        Keep a LISTEN connection until stop() is called.
+
+        Raises ConnectionError as soon as the driver reports the connection
+        closed, and lets a failed or hung health check propagate, so the
+        caller reconnects.
+        """
+        lost = asyncio.Event()
+
+        def on_termination(connection) -> None:
+            lost.set()
+
+        driver.add_termination_listener(on_termination)
+        waiters = [
+            asyncio.ensure_future(self._stopped.wait()),
+            asyncio.ensure_future(lost.wait()),
+        ]
+        try:
+            while True:
+                await asyncio.wait(
+                    waiters, timeout=LISTEN_HEALTH_CHECK_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if self._stopped.is_set():
+                    return
+                if lost.is_set():
+                    raise ConnectionError("LISTEN connection was closed")
+                await asyncio.wait_for(driver.execute("SELECT 1"), timeout=LISTEN_HEALTH_CHECK_SECONDS)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            driver.remove_termination_listener(on_termination)
+
+    async def _listen(self) -> None:
+        # Reconnect with backoff; subscribers resync via the change feed
+        delay = RECONNECT_DELAY_SECONDS
+        while not self._stopped.is_set():
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    await driver.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                    delay = RECONNECT_DELAY_SECONDS
+                    try:
+                        await self._hold(driver)
+                    finally:
+                        await driver.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+            except Exception:
+                logger.exception("Todo event listener failed, reconnecting in %.0fs", delay)
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    def start(self) -> None:
+        """Start listening (no-op unless the database is PostgreSQL)."""
+        if engine.dialect.name != "postgresql" or self._task is not None:
+            return
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        if self._task is None:
+            return
+        self._stopped.set()
+        await self._task
+        self._task = None
+
+
+@lru_cache()
+def get_todo_event_listener() -> TodoEventListener:
+    """
+    Get this worker's LISTEN loop (created once per process).
+    """
+    return TodoEventListener(get_todo_event_hub())
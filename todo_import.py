@@ -0,0 +1,172 @@
+"""
+Streaming bulk import of todos from NDJSON or CSV request bodies.
+
+The body is parsed line by line as it arrives, validated against the
+TodoCreate rules in chunks, and each valid chunk is bulk-loaded and
+committed before the next one is read.
+"""
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.schemas.todo import TodoCreate
+from app.services.todo_service import copy_todos
+
+
+# Rows validated and loaded per transaction
+IMPORT_CHUNK_SIZE = 1000
+
+# Upper bound on rows accepted in one import
+MAX_IMPORT_ROWS = 100_000
+
+# Per-row errors returned in the response; the total is always reported
+MAX_REPORTED_ERRORS = 100
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+async def _iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Split a streamed body into numbered text lines.
+
+    Args:
+        body: Request body chunks
+
+    Yields:
+        Tuples of (1-based line number, line without trailing newline)
+    """
+    pending = b""
+    line_number = 0
+    async for chunk in body:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.decode("utf-8", errors="replace").rstrip("\r")
+    if pending:
+        yield line_number + 1, pending.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def _iter_records(
+    body: AsyncIterator[bytes],
+    import_format: str
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Parse a streamed body into raw records.
+
+    CSV bodies start with a header row; each record must fit on one line.
+
+    Args:
+        body: Request body chunks
+        import_format: "ndjson" or "csv"
+
+    Yields:
+        Tuples of (line number, record or None, parse error or None)
+    """
+    header: Optional[List[str]] = None
+
+    async for line_number, line in _iter_lines(body):
+        if not line.strip():
+            continue
+
+        if import_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "Each line must be a JSON object"
+                continue
+            yield line_number, record, None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        record = dict(zip(header, values))
+        # An empty CSV cell means "no description"
+        if record.get("description") == "":
+            record["description"] = None
+        yield line_number, record, None
+
+
+async def import_todos(
+    session: AsyncSession,
+    user_id: UUID,
+    body: AsyncIterator[bytes],
+    import_format: str
+) -> Dict[str, Any]:
+    """
+    Import todos for a user from a streamed NDJSON or CSV body.
+
+    Invalid rows are skipped and reported; valid rows are loaded in chunks,
+    each committed on its own.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        body: Request body chunks
+        import_format: "ndjson" or "csv"
+
+    Returns:
+        Dict with imported/failed counts, per-row errors and whether the
+        row limit truncated the import
+    """
+    imported = 0
+    failed = 0
+    errors: List[Dict[str, Any]] = []
+    chunk: List[TodoCreate] = []
+    seen = 0
+    truncated = False
+
+    def report(line_number: int, message: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"line": line_number, "error": message})
+
+    async def flush() -> None:
+        nonlocal imported
+        if chunk:
+            await copy_todos(session, user_id, chunk)
+            await session.commit()
+            imported += len(chunk)
+            chunk.clear()
+
+    async for line_number, record, parse_error in _iter_records(body, import_format):
+        seen += 1
+        if seen > MAX_IMPORT_ROWS:
+            truncated = True
+            break
+
+        if parse_error is not None:
+            report(line_number, parse_error)
+            continue
+
+        try:
+            chunk.append(TodoCreate.model_validate(record))
+        except ValidationError as e:
+            report(line_number, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ))
+            continue
+
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            await flush()
+
+    await flush()
+
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "truncated": truncated
+    }
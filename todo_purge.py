@@ -0,0 +1,116 @@
+"""
+Background removal of soft-deleted todos.
+
+Deletes only set deleted_at; this job removes those rows once they are
+older than TODO_PURGE_RETENTION_HOURS. Each batch is its own short
+transaction over at most TODO_PURGE_BATCH_SIZE rows, with a pause between
+batches, so locks are held briefly and WAL is written at a steady rate
+instead of in one large spike.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import delete, select, tuple_
+from app.config import get_settings
+from app.database import async_session_maker
+from app.models.todo import Todo
+from app.models.todo_tag import TodoTag
+from app.models import todo_table  # noqa: F401 - maps deleted_at
+from app.utils.periodic import PeriodicJob
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+async def purge_deleted_todos_batch(cutoff: datetime, batch_size: int) -> int:
+    """
+    Permanently delete one batch of todos soft-deleted before cutoff.
+
+    Rows locked by another purger are skipped rather than waited on. The
+    delete names each row by (user_id, id), so on a partitioned table it
+    only touches the partitions holding the batch.
+
+    Args:
+        cutoff: Only rows with deleted_at before this time are removed
+        batch_size: Maximum number of rows to remove
+
+    Returns:
+        Number of rows removed
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Todo.user_id, Todo.id)
+            .where(Todo.deleted_at < cutoff)
+            .order_by(Todo.deleted_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        keys = [tuple(row) for row in result.all()]
+        if not keys:
+            return 0
+
+        await session.execute(
+            delete(Todo)
+            .where(tuple_(Todo.user_id, Todo.id).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(
+            delete(TodoTag)
+            .where(tuple_(TodoTag.user_id, TodoTag.todo_id).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+    return len(keys)
+
+
+async def purge_deleted_todos(
+    retention: Optional[timedelta] = None,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None
+) -> int:
+    """
+    Remove every todo soft-deleted longer ago than the retention period.
+
+    Also usable from maintenance scripts in place of large DELETEs.
+
+    Args:
+        retention: How long deleted rows are kept (default from settings)
+        batch_size: Rows per transaction (default from settings)
+        pause_seconds: Sleep between batches (default from settings)
+
+    Returns:
+        Total number of rows removed
+    """
+    if retention is None:
+        retention = timedelta(hours=settings.TODO_PURGE_RETENTION_HOURS)
+    if batch_size is None:
+        batch_size = settings.TODO_PURGE_BATCH_SIZE
+    if pause_seconds is None:
+        pause_seconds = settings.TODO_PURGE_BATCH_PAUSE_SECONDS
+
+    cutoff = datetime.utcnow() - retention
+    total = 0
+    while True:
+        removed = await purge_deleted_todos_batch(cutoff, batch_size)
+        total += removed
+        if removed < batch_size:
+            return total
+        await asyncio.sleep(pause_seconds)
+
+
+async def _purge_job() -> None:
+    removed = await purge_deleted_todos()
+    if removed:
+        logger.info("Purged %d soft-deleted todos", removed)
+
+
+@lru_cache()
+def get_todo_purger() -> PeriodicJob:
+    """
+    Get this worker's purge job (created once per process).
+    """
+    return PeriodicJob("todo-purge", settings.TODO_PURGE_INTERVAL_SECONDS, _purge_job)
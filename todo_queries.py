@@ -0,0 +1,282 @@
+"""
+Query building helpers for reading todos.
+Projection, filters, sorting and keyset pagination are pushed into SQL so
+clients only receive the rows and columns they display.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Select, false, func, true, tuple_
+from sqlalchemy.engine import Row
+from sqlmodel import select
+from app.models.todo import Todo
+from app.models.todo_tag import TodoTag
+from app.models import todo_table  # noqa: F401 - maps columns added after the initial schema
+from app.schemas.todo import TodoResponse
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+# Fields clients may request with fields=, in response order
+TODO_FIELDS = tuple(TodoResponse.model_fields)
+
+# Sortable columns exposed to clients
+SORT_COLUMNS = {
+    "created_at": Todo.created_at,
+    "updated_at": Todo.updated_at,
+    "title": Todo.title,
+}
+
+SORT_ORDERS = ("asc", "desc")
+
+# How a multi-tag filter combines: todos with any of the tags, or all of them
+TAG_MATCHES = ("any", "all")
+
+# Sort keys whose cursor values must be parsed back into datetimes
+_TIMESTAMP_SORTS = {"created_at", "updated_at"}
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """
+    Parse a comma-separated fields= parameter into response field names.
+
+    The id is always included so clients can address the returned todos.
+
+    Args:
+        fields: Comma-separated field names, or None for every field
+
+    Returns:
+        Field names in response order
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if fields is None:
+        return list(TODO_FIELDS)
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(TODO_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return [name for name in TODO_FIELDS if name in requested]
+
+
+def scope_to_user(statement, user_id: UUID):
+    """
+    Restrict a todo statement to a user's live (not soft-deleted) todos.
+
+    Every read and write of todos goes through this, so soft-deleted rows
+    are invisible and the partial read indexes always apply.
+
+    Args:
+        statement: SELECT, UPDATE or DELETE over the todos table
+        user_id: UUID of the owning user
+
+    Returns:
+        The restricted statement
+    """
+    return statement.where(Todo.user_id == user_id).where(Todo.deleted_at.is_(None))
+
+
+def select_todo_fields(field_names: List[str], *extra: str, model=Todo) -> Select:
+    """
+    Build a SELECT over only the given Todo columns.
+
+    Rows come back as plain tuples, skipping ORM identity-map bookkeeping.
+
+    Args:
+        field_names: Response fields to load
+        extra: Additional columns needed by the query (e.g. the sort key)
+        model: Table to read - Todo or ArchivedTodo
+
+    Returns:
+        Column-projected select statement
+    """
+    names = list(field_names) + [name for name in extra if name not in field_names]
+    return select(*(getattr(model, name) for name in names))
+
+
+def row_to_dict(row: Row, field_names: List[str]) -> Dict[str, Any]:
+    """
+    Convert a projected result row into a response dict.
+
+    Args:
+        row: Row returned by a select_todo_fields query
+        field_names: Response fields to include
+
+    Returns:
+        Dict with only the requested fields
+    """
+    mapping = row._mapping
+    return {name: mapping[name] for name in field_names}
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Timestamp columns hold naive UTC; clients may send Z or an offset
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def apply_todo_filters(
+    statement: Select,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None
+) -> Select:
+    """
+    Add optional WHERE clauses to a todo query.
+
+    Timezone-aware bounds are converted to naive UTC before comparing.
+
+    Args:
+        statement: Query already restricted to a single user
+        completed: Filter by completion status
+        created_after: Only todos created at or after this time
+        created_before: Only todos created before this time
+        updated_after: Only todos updated at or after this time
+        updated_before: Only todos updated before this time
+
+    Returns:
+        The filtered statement
+    """
+    if completed is not None:
+        # Inline the boolean so the planner can match partial indexes
+        statement = statement.where(Todo.completed == (true() if completed else false()))
+    created_after, created_before = _naive_utc(created_after), _naive_utc(created_before)
+    updated_after, updated_before = _naive_utc(updated_after), _naive_utc(updated_before)
+    if created_after is not None:
+        statement = statement.where(Todo.created_at >= created_after)
+    if created_before is not None:
+        statement = statement.where(Todo.created_at < created_before)
+    if updated_after is not None:
+        statement = statement.where(Todo.updated_at >= updated_after)
+    if updated_before is not None:
+        statement = statement.where(Todo.updated_at < updated_before)
+    return statement
+
+
+def apply_tag_filter(
+    statement: Select,
+    user_id: UUID,
+    tags: List[str],
+    match: str = "any"
+) -> Select:
+    """
+    Restrict a todo query to todos carrying the given tags.
+
+    The matching ids come from the (user_id, tag) index on todo_tags, so
+    the filter never reads todos that lack the tags.
+
+    Args:
+        statement: Query already restricted to the user
+        user_id: UUID of the owning user
+        tags: Normalized tags to match
+        match: "any" (OR) or "all" (AND)
+
+    Returns:
+        The filtered statement
+    """
+    if not tags:
+        return statement
+
+    matching = (
+        select(TodoTag.todo_id)
+        .where(TodoTag.user_id == user_id)
+        .where(TodoTag.tag.in_(tags))
+    )
+    if match == "all":
+        matching = matching.group_by(TodoTag.todo_id).having(
+            func.count(TodoTag.tag) == len(set(tags))
+        )
+    return statement.where(Todo.id.in_(matching))
+
+
+def apply_keyset_page(
+    statement: Select,
+    sort_by: str,
+    order: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    model=Todo
+) -> Select:
+    """
+    Order a todo query and restrict it to the page following the cursor.
+
+    One extra row is requested so callers can tell whether a next page exists.
+
+    Args:
+        statement: Filtered todo query
+        sort_by: Key from SORT_COLUMNS
+        order: "asc" or "desc"
+        limit: Page size
+        cursor: Opaque cursor from the previous page (optional)
+        model: Table being read - Todo or ArchivedTodo
+
+    Returns:
+        The ordered and limited statement
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    column = getattr(model, SORT_COLUMNS[sort_by].key)
+    descending = order == "desc"
+
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position.get("sort") != sort_by or position.get("order") != order:
+            raise ValueError("Cursor does not match the requested sort")
+        try:
+            value = position["value"]
+            if sort_by in _TIMESTAMP_SORTS:
+                value = datetime.fromisoformat(value)
+            after_id = UUID(position["id"])
+        except (KeyError, TypeError) as e:
+            raise ValueError("Malformed cursor") from e
+
+        key = tuple_(column, model.id)
+        after = tuple_(value, after_id)
+        statement = statement.where(key < after if descending else key > after)
+
+    if descending:
+        statement = statement.order_by(column.desc(), model.id.desc())
+    else:
+        statement = statement.order_by(column.asc(), model.id.asc())
+
+    return statement.limit(limit + 1)
+
+
+def split_page(
+    rows: List[Any],
+    sort_by: str,
+    order: str,
+    limit: int
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim the look-ahead row from a page and build the next cursor.
+
+    Args:
+        rows: Rows fetched with apply_keyset_page (up to limit + 1)
+        sort_by: Sort key used for the query
+        order: Sort order used for the query
+        limit: Page size
+
+    Returns:
+        Tuple of (rows for this page, next cursor or None)
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = list(rows[:limit])
+    last = rows[-1]
+    value = getattr(last, sort_by)
+    position: Dict[str, Any] = {
+        "sort": sort_by,
+        "order": order,
+        "value": value.isoformat() if isinstance(value, datetime) else value,
+        "id": str(last.id),
+    }
+    return rows, encode_cursor(position)
@@ -0,0 +1,224 @@
+"""
+Reminder scheduler for todos with a remind_at time.
+
+One worker at a time holds the "todo-reminders" lease. The holder loads
+the reminders due in the next TODO_REMINDER_WINDOW_SECONDS through the
+partial index on remind_at, keeps them in a heap, and sleeps until the
+earliest one is due, so the table is read once per window rather than
+scanned on a fixed tick.
+
+Firing is a conditional UPDATE that sets reminded_at only if the reminder
+is still pending and unchanged, with the reminder event published in the
+same transaction. A reminder therefore fires exactly once even if the
+lease moves to another worker mid-window. Reminders set for a time inside
+the window already loaded are picked up by the next window load.
+"""
+import asyncio
+import heapq
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import false, update
+from sqlmodel import select
+from app.config import get_settings
+from app.database import async_session_maker, dialect_insert
+from app.models.todo import Todo
+from app.models.scheduler_lease import SchedulerLease
+from app.services.todo_queries import scope_to_user
+from app.services.todo_events import publish_todo_event
+
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+LEASE_NAME = "todo-reminders"
+
+# Upper bound on reminders held in memory per window
+MAX_WINDOW_REMINDERS = 10_000
+
+# (remind_at, user_id, todo_id)
+Reminder = Tuple[datetime, UUID, UUID]
+
+
+async def acquire_lease(name: str, owner: str, duration: timedelta) -> bool:
+    """
+    Take or renew a named lease.
+
+    Succeeds if the lease is free, expired, or already held by owner.
+
+    Args:
+        name: Lease name
+        owner: Identifier of the calling worker
+        duration: How long the lease is held from now
+
+    Returns:
+        True if the caller holds the lease
+    """
+    now = datetime.utcnow()
+    async with async_session_maker() as session:
+        insert = dialect_insert(session)
+        statement = insert(SchedulerLease).values(
+            name=name, owner=owner, expires_at=now + duration
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[SchedulerLease.name],
+            set_={"owner": statement.excluded.owner, "expires_at": statement.excluded.expires_at},
+            where=(SchedulerLease.expires_at < now) | (SchedulerLease.owner == owner)
+        ).returning(SchedulerLease.owner)
+        result = await session.execute(statement)
+        held = result.first() is not None
+        await session.commit()
+    return held
+
+
+async def load_due_reminders(until: datetime, limit: int = MAX_WINDOW_REMINDERS) -> List[Reminder]:
+    """
+    Load pending reminders of open todos due before a time, earliest first.
+
+    Overdue reminders (e.g. missed while no worker held the lease) are
+    included so they still fire.
+
+    Args:
+        until: End of the window
+        limit: Maximum number of reminders to load
+
+    Returns:
+        List of (remind_at, user_id, todo_id) tuples
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(Todo.remind_at, Todo.user_id, Todo.id)
+            .where(Todo.remind_at.isnot(None))
+            .where(Todo.reminded_at.is_(None))
+            .where(Todo.deleted_at.is_(None))
+            .where(Todo.completed == false())
+            .where(Todo.remind_at < until)
+            .order_by(Todo.remind_at)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+
+async def fire_reminder(reminder: Reminder) -> bool:
+    """
+    Mark a reminder as sent and publish its event, at most once.
+
+    Args:
+        reminder: (remind_at, user_id, todo_id) as loaded
+
+    Returns:
+        True if this call fired the reminder
+    """
+    remind_at, user_id, todo_id = reminder
+    async with async_session_maker() as session:
+        result = await session.execute(
+            scope_to_user(update(Todo).where(Todo.id == todo_id), user_id)
+            .where(Todo.remind_at == remind_at)
+            .where(Todo.reminded_at.is_(None))
+            .where(Todo.completed == false())
+            .values(reminded_at=datetime.utcnow())
+            .returning(Todo.id, Todo.title, Todo.due_at)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
+            # Already fired, rescheduled, completed elsewhere or deleted
+            return False
+
+        await publish_todo_event(session, {
+            "type": "reminder",
+            "user_id": str(user_id),
+            "todo_id": str(row.id),
+            "title": row.title,
+            "due_at": row.due_at.isoformat() if row.due_at else None,
+            "remind_at": remind_at.isoformat(),
+        })
+        await session.commit()
+    return True
+
+
+class ReminderScheduler:
+    """Heap-based reminder loop run by the worker holding the lease."""
+
+    def __init__(self, window_seconds: float, lease_seconds: float):
+        self.window = timedelta(seconds=window_seconds)
+        self.lease = timedelta(seconds=lease_seconds)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._heap: List[Reminder] = []
+        self._window_end: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = asyncio.Event()
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    async def _tick(self) -> float:
+        """Run one scheduling step and return how long to sleep."""
+        renew_in = self.lease.total_seconds() / 3
+        if not await acquire_lease(LEASE_NAME, self.owner, self.lease):
+            # Another worker schedules; stand by to take over
+            self._heap = []
+            self._window_end = None
+            return renew_in
+
+        now = datetime.utcnow()
+        if self._window_end is None or now >= self._window_end:
+            self._window_end = now + self.window
+            self._heap = await load_due_reminders(self._window_end)
+            heapq.heapify(self._heap)
+
+        while self._heap and self._heap[0][0] <= datetime.utcnow():
+            reminder = heapq.heappop(self._heap)
+            try:
+                await fire_reminder(reminder)
+            except Exception:
+                logger.exception("Failed to fire reminder for todo %s", reminder[2])
+
+        now = datetime.utcnow()
+        wake_at = self._window_end
+        if self._heap and self._heap[0][0] < wake_at:
+            wake_at = self._heap[0][0]
+        return min((wake_at - now).total_seconds(), renew_in)
+
+    async def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                delay = await self._tick()
+            except Exception:
+                logger.exception("Reminder scheduler step failed")
+                delay = self.lease.total_seconds() / 3
+            await self._sleep(delay)
+
+    def start(self) -> None:
+        """Start the scheduler loop."""
+        if self._task is not None:
+            return
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the loop; the lease lapses on its own for another worker."""
+        if self._task is None:
+            return
+        self._stopped.set()
+        await self._task
+        self._task = None
+
+
+@lru_cache()
+def get_reminder_scheduler() -> ReminderScheduler:
+    """
+    Get this worker's reminder scheduler (created once per process).
+    """
+    return ReminderScheduler(
+        settings.TODO_REMINDER_WINDOW_SECONDS,
+        settings.TODO_REMINDER_LEASE_SECONDS
+    )
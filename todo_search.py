@@ -0,0 +1,160 @@
+"""
+Full-text search over todo titles and descriptions.
+
+PostgreSQL uses a generated tsvector column with a GIN index.
+SQLite (local runs) falls back to an FTS5 external-content table kept in
+sync by triggers.
+"""
+from typing import List, Tuple
+from uuid import UUID
+from sqlalchemy import column, func, literal_column, table, text
+from sqlalchemy.engine import Connection
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.todo import Todo
+from app.services.todo_queries import scope_to_user
+
+
+TEXT_SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_INDEX_NAME = "ix_todos_search_vector"
+FTS_TABLE = "todo_fts"
+
+# Lightweight handle on the SQLite FTS5 table (rank is its bm25 hidden column)
+_fts = table(FTS_TABLE, column("rowid"), column("rank"))
+
+
+def install_search_ddl(connection: Connection) -> None:
+    """
+    Create the dialect-specific search column/index or FTS table.
+
+    Idempotent, intended for conn.run_sync() at startup.
+
+    Args:
+        connection: Synchronous connection inside an open transaction
+    """
+    todo_table = Todo.__table__.name
+    dialect = connection.dialect.name
+
+    if dialect == "postgresql":
+        connection.execute(text(
+            f"ALTER TABLE {todo_table} "
+            f"ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector "
+            f"GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+            f") STORED"
+        ))
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX_NAME} "
+            f"ON {todo_table} USING GIN ({SEARCH_VECTOR_COLUMN})"
+        ))
+
+    elif dialect == "sqlite":
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE}
+        ).first()
+        if exists:
+            return
+
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"title, description, content='{todo_table}', content_rowid='rowid')"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {todo_table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, title, description) "
+            f"VALUES (new.rowid, new.title, new.description); END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {todo_table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+            f"VALUES ('delete', old.rowid, old.title, old.description); END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF title, description ON {todo_table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+            f"VALUES ('delete', old.rowid, old.title, old.description); "
+            f"INSERT INTO {FTS_TABLE}(rowid, title, description) "
+            f"VALUES (new.rowid, new.title, new.description); END"
+        ))
+        # Index rows that existed before the FTS table
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _fts5_match_expression(query: str) -> str:
+    """
+    Quote each search term so user input is never parsed as FTS5 syntax.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        FTS5 MATCH expression requiring every term
+    """
+    terms = query.split()
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+async def search_todos(
+    session: AsyncSession,
+    user_id: UUID,
+    query: str,
+    limit: int
+) -> List[Tuple[Todo, float]]:
+    """
+    Return a user's todos matching the query, best match first.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user whose todos are searched
+        query: Search text
+        limit: Maximum number of matches
+
+    Returns:
+        List of (todo, rank) tuples; higher rank means a better match
+    """
+    dialect = session.bind.dialect.name
+
+    if dialect == "postgresql":
+        ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        search_vector = literal_column(SEARCH_VECTOR_COLUMN)
+        rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+        statement = (
+            scope_to_user(select(Todo, rank), user_id)
+            .where(search_vector.op("@@")(ts_query))
+            .order_by(rank.desc(), Todo.id)
+            .limit(limit)
+        )
+        result = await session.execute(statement)
+        return [(todo, float(score)) for todo, score in result.all()]
+
+    if dialect == "sqlite":
+        match = _fts5_match_expression(query)
+        if not match:
+            return []
+        todo_rowid = literal_column(f"{Todo.__table__.name}.rowid")
+        statement = (
+            select(Todo, _fts.c.rank)
+            .join(_fts, _fts.c.rowid == todo_rowid)
+            .where(literal_column(FTS_TABLE).op("MATCH")(match))
+            .where(Todo.user_id == user_id)
+            .where(Todo.deleted_at.is_(None))
+            .order_by(_fts.c.rank, Todo.id)
+            .limit(limit)
+        )
+        result = await session.execute(statement)
+        # bm25 scores are lower-is-better; negate so callers can sort descending
+        return [(todo, -float(score)) for todo, score in result.all()]
+
+    # Other backends: plain substring match without ranking
+    pattern = f"%{query}%"
+    statement = (
+        scope_to_user(select(Todo), user_id)
+        .where(Todo.title.ilike(pattern) | Todo.description.ilike(pattern))
+        .order_by(Todo.created_at.desc(), Todo.id.desc())
+        .limit(limit)
+    )
+    result = await session.execute(statement)
+    return [(todo, 0.0) for todo in result.scalars().all()]
@@ -0,0 +1,483 @@
+"""
+Todo write operations shared by the REST routes and the chat agent tools.
+
+Each mutation is a single set-based statement with RETURNING, so the
+database round trip that changes a row also yields its new state. Every
+write goes through _record_write(), which updates the delta-sync change
+feed and the per-user counters in the same transaction, drops the
+user's cached reads and publishes a change event for subscribers.
+Functions do not commit; callers own the transaction.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import insert, not_, select, text, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.todo import Todo
+from app.schemas.todo import TodoCreate
+from app.services.todo_queries import TODO_FIELDS, row_to_dict, scope_to_user
+from app.services.todo_sync import record_todo_changes
+from app.services.todo_stats import adjust_todo_stats
+from app.services.todo_cache import get_todo_cache
+from app.services.todo_events import publish_todo_change
+from app.services.todo_tags import write_todo_tags
+
+
+# Upper bound on operations accepted in one batch request
+MAX_BATCH_OPERATIONS = 500
+
+
+# Columns returned by every mutation, in response order
+_RETURNING = tuple(getattr(Todo, name) for name in TODO_FIELDS)
+
+
+class TodoVersionConflict(Exception):
+    """Raised when a conditional write finds a newer version of the todo."""
+
+    def __init__(self, current_version: int):
+        super().__init__(f"Todo has been modified (current version {current_version})")
+        self.current_version = current_version
+
+
+def _scoped(statement, user_id: UUID, todo_id: UUID, expected_version: Optional[int]):
+    """Restrict a single-todo write to its owner and, optionally, a version."""
+    statement = scope_to_user(statement.where(Todo.id == todo_id), user_id)
+    if expected_version is not None:
+        statement = statement.where(Todo.version == expected_version)
+    return statement
+
+
+async def _raise_if_conflict(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_id: UUID,
+    expected_version: Optional[int]
+) -> None:
+    """
+    Explain why a conditional write matched no row.
+
+    Only runs after a miss, so successful writes stay one round trip.
+
+    Raises:
+        TodoVersionConflict: If the todo exists with another version
+    """
+    if expected_version is None:
+        return
+
+    result = await session.execute(
+        scope_to_user(select(Todo.version).where(Todo.id == todo_id), user_id)
+    )
+    current_version = result.scalar_one_or_none()
+    if current_version is not None:
+        raise TodoVersionConflict(current_version)
+
+
+async def _record_write(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_ids: List[UUID],
+    deleted: bool = False,
+    created: int = 0,
+    open_delta: int = 0,
+    completed_delta: int = 0
+) -> None:
+    """
+    Bookkeeping shared by every todo write.
+
+    Args:
+        session: Database session (same transaction as the write)
+        user_id: UUID of the owning user
+        todo_ids: UUIDs of the written todos
+        deleted: True if the todos were deleted
+        created: Number of todos created
+        open_delta: Change in open todos
+        completed_delta: Change in completed todos
+    """
+    if not todo_ids:
+        return
+
+    version = await record_todo_changes(session, user_id, todo_ids, deleted=deleted)
+    await adjust_todo_stats(
+        session,
+        user_id,
+        created=created,
+        open_delta=open_delta,
+        completed_delta=completed_delta
+    )
+    await get_todo_cache().invalidate_user(user_id)
+    await publish_todo_change(session, user_id, version, todo_ids, deleted=deleted)
+
+
+async def insert_todos(
+    session: AsyncSession,
+    user_id: UUID,
+    items: List[TodoCreate]
+) -> List[Dict[str, Any]]:
+    """
+    Create todos for a user in one multi-row INSERT ... RETURNING statement.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        items: Validated todo creation data
+
+    Returns:
+        The created todos as response dicts, in input order
+    """
+    if not items:
+        return []
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid4(),
+            "user_id": user_id,
+            "title": item.title,
+            "description": item.description,
+            "completed": False,
+            "due_at": item.due_at,
+            "remind_at": item.remind_at,
+            "tags": item.tags,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for item in items
+    ]
+    result = await session.execute(
+        insert(Todo).values(rows).returning(*_RETURNING)
+    )
+    created = {row.id: row_to_dict(row, list(TODO_FIELDS)) for row in result.all()}
+    await write_todo_tags(session, user_id, {row["id"]: row["tags"] for row in rows if row["tags"]})
+    await _record_write(
+        session, user_id, [row["id"] for row in rows], created=len(rows), open_delta=len(rows)
+    )
+    return [created[row["id"]] for row in rows]
+
+
+async def copy_todos(
+    session: AsyncSession,
+    user_id: UUID,
+    items: List[TodoCreate]
+) -> List[UUID]:
+    """
+    Bulk-load todos for a user without returning their rows.
+
+    Uses COPY (asyncpg copy_records_to_table) on PostgreSQL and a batched
+    executemany INSERT elsewhere. Intended for imports of many rows.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        items: Validated todo creation data
+
+    Returns:
+        UUIDs of the created todos, in input order
+    """
+    if not items:
+        return []
+
+    now = datetime.utcnow()
+    columns = [
+        "id", "user_id", "title", "description", "completed",
+        "due_at", "remind_at", "tags", "created_at", "updated_at",
+    ]
+    records = [
+        (
+            uuid4(), user_id, item.title, item.description, False,
+            item.due_at, item.remind_at, item.tags, now, now
+        )
+        for item in items
+    ]
+
+    tags_index = columns.index("tags")
+
+    if session.bind.dialect.name == "postgresql":
+        # The COPY goes through the raw connection, which only joins the
+        # session's transaction once SQLAlchemy has opened it; a first
+        # statement through the session does that, so the COPY rolls back
+        # with everything else
+        await session.execute(text("SELECT 1"))
+
+        # COPY sends json columns as text
+        copy_records = [
+            record[:tags_index] + (json.dumps(record[tags_index]),) + record[tags_index + 1:]
+            for record in records
+        ]
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Todo.__table__.name,
+            records=copy_records,
+            columns=columns
+        )
+    else:
+        await session.execute(
+            insert(Todo.__table__),
+            [dict(zip(columns, record)) for record in records]
+        )
+
+    await write_todo_tags(
+        session,
+        user_id,
+        {record[0]: record[tags_index] for record in records if record[tags_index]}
+    )
+
+    # After the insert: a first write seeds the counters from the todos table
+    todo_ids = [record[0] for record in records]
+    await _record_write(
+        session, user_id, todo_ids, created=len(todo_ids), open_delta=len(todo_ids)
+    )
+    return todo_ids
+
+
+async def update_todo_fields(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_id: UUID,
+    values: Dict[str, Any],
+    expected_version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Update a user's todo in one UPDATE ... RETURNING statement.
+
+    A completed value is written in the same UPDATE. Because RETURNING only
+    shows the new status, the row is first locked and its old status read,
+    so the per-user counters move by the actual transition.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_id: UUID of the todo to update
+        values: Column values to set; updated_at and version
+            are always advanced, a new remind_at re-arms the reminder and
+            tags replace the todo's tag list
+        expected_version: Only write if the todo is still at this version
+
+    Returns:
+        The updated todo as a response dict, or None if not found
+
+    Raises:
+        TodoVersionConflict: If expected_version is stale
+    """
+    if "remind_at" in values:
+        values = {**values, "reminded_at": None}
+
+    open_delta = completed_delta = 0
+    if "completed" in values:
+        result = await session.execute(
+            _scoped(select(Todo.completed), user_id, todo_id, expected_version).with_for_update()
+        )
+        previous = result.scalar_one_or_none()
+        if previous is None:
+            await _raise_if_conflict(session, user_id, todo_id, expected_version)
+            return None
+        if previous != values["completed"]:
+            step = 1 if values["completed"] else -1
+            open_delta, completed_delta = -step, step
+
+    statement = _scoped(update(Todo), user_id, todo_id, expected_version)
+    statement = (
+        statement
+        .values(**values, updated_at=datetime.utcnow(), version=Todo.version + 1)
+        .returning(*_RETURNING)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    row = result.first()
+    if row is None:
+        await _raise_if_conflict(session, user_id, todo_id, expected_version)
+        return None
+
+    if "tags" in values:
+        await write_todo_tags(session, user_id, {row.id: values["tags"]}, replace=True)
+
+    await _record_write(
+        session, user_id, [row.id], open_delta=open_delta, completed_delta=completed_delta
+    )
+    return row_to_dict(row, list(TODO_FIELDS))
+
+
+async def toggle_todo_completed(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_id: UUID,
+    expected_version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Flip a todo's completion status atomically in SQL.
+
+    Concurrent toggles each apply on top of the committed value, so no
+    client's change is lost.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_id: UUID of the todo to toggle
+        expected_version: Only write if the todo is still at this version
+
+    Returns:
+        The updated todo as a response dict, or None if not found
+
+    Raises:
+        TodoVersionConflict: If expected_version is stale
+    """
+    statement = _scoped(update(Todo), user_id, todo_id, expected_version)
+    statement = (
+        statement
+        .values(
+            completed=not_(Todo.completed),
+            updated_at=datetime.utcnow(),
+            version=Todo.version + 1
+        )
+        .returning(*_RETURNING)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    row = result.first()
+    if row is None:
+        await _raise_if_conflict(session, user_id, todo_id, expected_version)
+        return None
+
+    # The returned row holds the new status, so the old one is its negation
+    step = 1 if row.completed else -1
+    await _record_write(session, user_id, [row.id], open_delta=-step, completed_delta=step)
+    return row_to_dict(row, list(TODO_FIELDS))
+
+
+async def delete_todo_row(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_id: UUID,
+    expected_version: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Soft-delete a user's todo in one UPDATE ... RETURNING statement.
+
+    The row is hidden from every read at once and removed later in
+    batches by the purge job.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_id: UUID of the todo to delete
+        expected_version: Only delete if the todo is still at this version
+
+    Returns:
+        Dict with the deleted todo's id and title, or None if not found
+
+    Raises:
+        TodoVersionConflict: If expected_version is stale
+    """
+    statement = _scoped(update(Todo), user_id, todo_id, expected_version)
+    statement = (
+        statement
+        .values(deleted_at=datetime.utcnow(), version=Todo.version + 1)
+        .returning(Todo.id, Todo.title, Todo.completed)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    row = result.first()
+    if row is None:
+        await _raise_if_conflict(session, user_id, todo_id, expected_version)
+        return None
+
+    await _record_write(
+        session,
+        user_id,
+        [row.id],
+        deleted=True,
+        open_delta=0 if row.completed else -1,
+        completed_delta=-1 if row.completed else 0
+    )
+    return row_to_dict(row, ["id", "title"])
+
+
+async def set_todos_completed(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_ids: List[UUID],
+    completed: bool
+) -> List[Dict[str, Any]]:
+    """
+    Set the completion status of many todos in one UPDATE ... RETURNING.
+
+    Only todos whose status actually changes are written, which also tells
+    the per-user counters exactly how many moved. Todos already in the
+    requested state are read back unchanged.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_ids: UUIDs of the todos to change
+        completed: Completion status to set
+
+    Returns:
+        The matching todos as response dicts; missing ids are omitted
+    """
+    if not todo_ids:
+        return []
+
+    statement = (
+        scope_to_user(update(Todo).where(Todo.id.in_(todo_ids)), user_id)
+        .where(Todo.completed != completed)
+        .values(completed=completed, updated_at=datetime.utcnow(), version=Todo.version + 1)
+        .returning(*_RETURNING)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    todos = [row_to_dict(row, list(TODO_FIELDS)) for row in result.all()]
+
+    changed_ids = [todo["id"] for todo in todos]
+    step = len(changed_ids) if completed else -len(changed_ids)
+    await _record_write(session, user_id, changed_ids, open_delta=-step, completed_delta=step)
+
+    unchanged_ids = set(todo_ids) - set(changed_ids)
+    if unchanged_ids:
+        result = await session.execute(
+            scope_to_user(select(*_RETURNING).where(Todo.id.in_(unchanged_ids)), user_id)
+        )
+        todos.extend(row_to_dict(row, list(TODO_FIELDS)) for row in result.all())
+
+    return todos
+
+
+async def delete_todo_rows(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_ids: List[UUID]
+) -> List[UUID]:
+    """
+    Soft-delete many of a user's todos in one UPDATE ... RETURNING statement.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_ids: UUIDs of the todos to delete
+
+    Returns:
+        UUIDs of the todos that were deleted
+    """
+    if not todo_ids:
+        return []
+
+    statement = (
+        scope_to_user(update(Todo).where(Todo.id.in_(todo_ids)), user_id)
+        .values(deleted_at=datetime.utcnow(), version=Todo.version + 1)
+        .returning(Todo.id, Todo.completed)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    rows = result.all()
+
+    deleted = [row.id for row in rows]
+    completed = sum(1 for row in rows if row.completed)
+    await _record_write(
+        session,
+        user_id,
+        deleted,
+        deleted=True,
+        open_delta=-(len(rows) - completed),
+        completed_delta=-completed
+    )
+    return deleted
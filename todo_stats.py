@@ -0,0 +1,177 @@
+"""
+Per-user todo statistics maintained incrementally by the write paths.
+
+Write paths call adjust_todo_stats() in the same transaction as their
+change. The first time a user's counters are touched they are seeded from
+the todos table once; after that no read or write counts rows.
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy import func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import dialect_insert
+from app.models.todo import Todo
+from app.models.user_todo_stats import UserTodoStats, UserTodoDailyStats
+from app.models.archived_todo import ArchivedTodo
+from app.services.todo_queries import scope_to_user
+
+
+# Longest "created in the last N days" window served from daily counters
+MAX_STATS_WINDOW_DAYS = 90
+
+
+async def _seed_todo_stats(session: AsyncSession, user_id: UUID) -> None:
+    """
+    Initialize a user's counters from the todos table.
+
+    Runs once per user. Concurrent seeders insert identical rows and the
+    loser's insert is ignored.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user
+    """
+    result = await session.execute(
+        scope_to_user(select(func.count(), func.count().filter(Todo.completed)), user_id)
+    )
+    total, completed = result.one()
+
+    # Archived todos are completed todos that left the hot table
+    result = await session.execute(
+        select(func.count()).select_from(ArchivedTodo).where(ArchivedTodo.user_id == user_id)
+    )
+    archived = result.scalar_one()
+    total += archived
+    completed += archived
+
+    insert = dialect_insert(session)
+    await session.execute(
+        insert(UserTodoStats)
+        .values(
+            user_id=user_id,
+            total_count=total,
+            open_count=total - completed,
+            completed_count=completed,
+            updated_at=datetime.utcnow()
+        )
+        .on_conflict_do_nothing(index_elements=[UserTodoStats.user_id])
+    )
+
+    window_start = datetime.utcnow().date() - timedelta(days=MAX_STATS_WINDOW_DAYS)
+    result = await session.execute(
+        scope_to_user(select(Todo.created_at), user_id)
+        .where(Todo.created_at >= datetime.combine(window_start, datetime.min.time()))
+    )
+    per_day: Dict[date, int] = {}
+    for created_at in result.scalars():
+        per_day[created_at.date()] = per_day.get(created_at.date(), 0) + 1
+
+    if per_day:
+        await session.execute(
+            insert(UserTodoDailyStats)
+            .values([
+                {"user_id": user_id, "day": day, "created_count": count}
+                for day, count in per_day.items()
+            ])
+            .on_conflict_do_nothing(
+                index_elements=[UserTodoDailyStats.user_id, UserTodoDailyStats.day]
+            )
+        )
+
+
+async def adjust_todo_stats(
+    session: AsyncSession,
+    user_id: UUID,
+    created: int = 0,
+    open_delta: int = 0,
+    completed_delta: int = 0
+) -> None:
+    """
+    Apply a change to a user's todo counters.
+
+    Must run after the write it describes, in the same transaction. If the
+    user has no counters yet they are seeded from the todos table, which
+    already includes this write, so the delta is not applied again.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        created: Number of todos created (counted for today)
+        open_delta: Change in open todos
+        completed_delta: Change in completed todos
+    """
+    if not (created or open_delta or completed_delta):
+        return
+
+    result = await session.execute(
+        update(UserTodoStats)
+        .where(UserTodoStats.user_id == user_id)
+        .values(
+            total_count=UserTodoStats.total_count + open_delta + completed_delta,
+            open_count=UserTodoStats.open_count + open_delta,
+            completed_count=UserTodoStats.completed_count + completed_delta,
+            updated_at=datetime.utcnow()
+        )
+        .returning(UserTodoStats.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.first() is None:
+        await _seed_todo_stats(session, user_id)
+        return
+
+    if created:
+        insert = dialect_insert(session)
+        statement = insert(UserTodoDailyStats).values(
+            user_id=user_id,
+            day=datetime.utcnow().date(),
+            created_count=created
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[UserTodoDailyStats.user_id, UserTodoDailyStats.day],
+            set_={"created_count": UserTodoDailyStats.created_count + created}
+        )
+        await session.execute(statement)
+
+
+async def get_todo_stats(session: AsyncSession, user_id: UUID, days: int) -> Dict[str, Any]:
+    """
+    Read a user's todo statistics.
+
+    Seeds the user's counters on first use; the caller commits.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user
+        days: Window for the created-recently count (1-MAX_STATS_WINDOW_DAYS)
+
+    Returns:
+        Dict with total, open, completed and created_recently counts
+    """
+    result = await session.execute(
+        select(UserTodoStats).where(UserTodoStats.user_id == user_id)
+    )
+    stats = result.scalar_one_or_none()
+
+    if stats is None:
+        await _seed_todo_stats(session, user_id)
+        result = await session.execute(
+            select(UserTodoStats).where(UserTodoStats.user_id == user_id)
+        )
+        stats = result.scalar_one()
+
+    window_start = datetime.utcnow().date() - timedelta(days=days - 1)
+    result = await session.execute(
+        select(func.coalesce(func.sum(UserTodoDailyStats.created_count), 0))
+        .where(UserTodoDailyStats.user_id == user_id)
+        .where(UserTodoDailyStats.day >= window_start)
+    )
+
+    return {
+        "total": stats.total_count,
+        "open": stats.open_count,
+        "completed": stats.completed_count,
+        "created_recently": result.scalar_one(),
+        "days": days
+    }
@@ -0,0 +1,157 @@
+"""
+Delta-sync support for todos.
+
+Write paths call record_todo_changes() inside their transaction; clients
+read the feed with list_todo_changes() to fetch only what changed since
+their last cursor, including tombstones for deleted todos.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.database import dialect_insert
+from app.models.todo import Todo
+from app.models.todo_change import TodoChange, UserTodoVersion
+from app.services.todo_queries import TODO_FIELDS
+
+
+async def bump_todo_version(session: AsyncSession, user_id: UUID, count: int = 1) -> int:
+    """
+    Reserve `count` change sequence numbers for a user.
+
+    The per-user row stays locked until the caller commits, so concurrent
+    writers for the same user are assigned sequences in commit order.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user whose todos changed
+        count: Number of sequence numbers to reserve
+
+    Returns:
+        The user's new version (the last reserved sequence number)
+    """
+    insert = dialect_insert(session)
+    statement = insert(UserTodoVersion).values(user_id=user_id, version=count)
+    statement = statement.on_conflict_do_update(
+        index_elements=[UserTodoVersion.user_id],
+        set_={"version": UserTodoVersion.version + count}
+    ).returning(UserTodoVersion.version)
+    result = await session.execute(statement)
+    return result.scalar_one()
+
+
+async def record_todo_changes(
+    session: AsyncSession,
+    user_id: UUID,
+    todo_ids: List[UUID],
+    deleted: bool = False
+) -> Optional[int]:
+    """
+    Record that todos were created, updated or deleted.
+
+    Must run in the same transaction as the write it describes.
+
+    Args:
+        session: Database session
+        user_id: UUID of the owning user
+        todo_ids: UUIDs of the changed todos
+        deleted: True if the todos were deleted (records tombstones)
+
+    Returns:
+        The user's new version, or None if nothing changed
+    """
+    todo_ids = list(dict.fromkeys(todo_ids))
+    if not todo_ids:
+        return None
+
+    version = await bump_todo_version(session, user_id, len(todo_ids))
+    first_seq = version - len(todo_ids) + 1
+    now = datetime.utcnow()
+
+    insert = dialect_insert(session)
+    statement = insert(TodoChange).values([
+        {
+            "user_id": user_id,
+            "todo_id": todo_id,
+            "seq": first_seq + offset,
+            "deleted": deleted,
+            "changed_at": now,
+        }
+        for offset, todo_id in enumerate(todo_ids)
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=[TodoChange.user_id, TodoChange.todo_id],
+        set_={
+            "seq": statement.excluded.seq,
+            "deleted": statement.excluded.deleted,
+            "changed_at": statement.excluded.changed_at,
+        }
+    )
+    await session.execute(statement)
+    return version
+
+
+async def get_todo_version(session: AsyncSession, user_id: UUID) -> int:
+    """
+    Get a user's current change sequence (0 if the user never wrote a todo).
+
+    Args:
+        session: Database session
+        user_id: UUID of the user
+
+    Returns:
+        The user's current version
+    """
+    result = await session.execute(
+        select(UserTodoVersion.version).where(UserTodoVersion.user_id == user_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def list_todo_changes(
+    session: AsyncSession,
+    user_id: UUID,
+    since: int,
+    limit: int
+) -> Tuple[List[Dict[str, Any]], List[UUID], int, bool]:
+    """
+    Fetch todos changed after a change sequence.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user
+        since: Last change sequence the client has applied
+        limit: Maximum number of changes to return
+
+    Returns:
+        Tuple of (changed todos, deleted todo ids, sequence to resume from,
+        whether more changes are pending)
+    """
+    todo_columns = [getattr(Todo, name) for name in TODO_FIELDS]
+    statement = (
+        select(TodoChange.todo_id, TodoChange.seq, TodoChange.deleted, *todo_columns)
+        .select_from(TodoChange)
+        .outerjoin(Todo, (Todo.id == TodoChange.todo_id) & (Todo.user_id == TodoChange.user_id))
+        .where(TodoChange.user_id == user_id)
+        .where(TodoChange.seq > since)
+        .order_by(TodoChange.seq)
+        .limit(limit + 1)
+    )
+    result = await session.execute(statement)
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    changed = []
+    deleted = []
+    for row in rows:
+        if row.deleted or row.id is None:
+            deleted.append(row.todo_id)
+        else:
+            mapping = row._mapping
+            changed.append({name: mapping[name] for name in TODO_FIELDS})
+
+    last_seq = rows[-1].seq if rows else since
+    return changed, deleted, last_seq, has_more
@@ -0,0 +1,290 @@
+"""
+Columns, indexes and DDL for the todos table that are maintained alongside
+the Todo model.
+
+Columns added after the initial schema are mapped onto Todo here (SQLAlchemy
+declarative classes accept new Column attributes after creation) and added
+to existing databases by add_missing_todo_columns() at startup.
+
+On PostgreSQL the table can be hash-partitioned on user_id (TODO_PARTITIONS).
+Every todo query is scoped to one user, so each touches a single partition.
+"""
+from sqlalchemy import (
+    JSON, Column, DateTime, Index, Integer, MetaData, PrimaryKeyConstraint, false, inspect, text,
+    true
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.schema import CreateColumn
+from app.models.todo import Todo
+from app.models.archived_todo import ArchivedTodo
+
+
+# Optimistic concurrency: incremented by every write, checked against If-Match
+Todo.version = Column("version", Integer, nullable=False, default=1, server_default="1")
+
+# Soft delete: deleted rows stay invisible to reads until the purge job removes them
+Todo.deleted_at = Column("deleted_at", DateTime, nullable=True)
+
+# Due dates and reminders; reminded_at records that the reminder for the
+# current remind_at has fired and is cleared whenever remind_at changes
+Todo.due_at = Column("due_at", DateTime, nullable=True)
+Todo.remind_at = Column("remind_at", DateTime, nullable=True)
+Todo.reminded_at = Column("reminded_at", DateTime, nullable=True)
+
+# Tags as returned to clients; filtering uses the normalized todo_tags table
+Todo.tags = Column("tags", JSON, nullable=False, server_default="[]")
+
+# Read indexes only cover live rows; soft-deleted ones never bloat them
+_live = Todo.deleted_at.is_(None)
+
+
+# Keyset pagination over a user's todos, newest first.
+# Every page is a single range scan starting at (user_id, created_at, id).
+ix_todos_user_created = Index(
+    "ix_todos_live_user_created_id",
+    Todo.user_id,
+    Todo.created_at.desc(),
+    Todo.id.desc(),
+    postgresql_where=_live,
+    sqlite_where=_live,
+)
+
+# Open todos per user - the default view of most clients.
+# Partial, so completed rows never bloat the index the UI scans.
+ix_todos_user_open = Index(
+    "ix_todos_live_user_open_created_id",
+    Todo.user_id,
+    Todo.created_at.desc(),
+    Todo.id.desc(),
+    postgresql_where=(Todo.completed == false()) & _live,
+    sqlite_where=(Todo.completed == false()) & _live,
+)
+
+# Recently changed todos per user (sort_by=updated_at, updated_* filters)
+ix_todos_user_updated = Index(
+    "ix_todos_live_user_updated_id",
+    Todo.user_id,
+    Todo.updated_at.desc(),
+    Todo.id.desc(),
+    postgresql_where=_live,
+    sqlite_where=_live,
+)
+
+# Alphabetical listing (sort_by=title)
+ix_todos_user_title = Index(
+    "ix_todos_live_user_title_id",
+    Todo.user_id,
+    Todo.title,
+    Todo.id,
+    postgresql_where=_live,
+    sqlite_where=_live,
+)
+
+# Purge job: oldest soft-deleted rows first, live rows not indexed at all
+ix_todos_deleted_at = Index(
+    "ix_todos_deleted_at",
+    Todo.deleted_at,
+    postgresql_where=Todo.deleted_at.isnot(None),
+    sqlite_where=Todo.deleted_at.isnot(None),
+)
+
+# Archive job: completed live todos by last change, oldest first
+ix_todos_completed_updated = Index(
+    "ix_todos_completed_updated",
+    Todo.updated_at,
+    postgresql_where=(Todo.completed == true()) & _live,
+    sqlite_where=(Todo.completed == true()) & _live,
+)
+
+# Reminder scheduler: pending reminders by time, loaded one window at a time
+ix_todos_pending_reminders = Index(
+    "ix_todos_pending_reminders",
+    Todo.remind_at,
+    postgresql_where=Todo.remind_at.isnot(None) & Todo.reminded_at.is_(None) & _live,
+    sqlite_where=Todo.remind_at.isnot(None) & Todo.reminded_at.is_(None) & _live,
+)
+
+# Indexes replaced by the definitions above, dropped at startup
+_RETIRED_INDEXES = (
+    "ix_todos_user_created_id",
+    "ix_todos_user_open_created_id",
+    "ix_todos_user_updated_id",
+    "ix_todos_user_title_id",
+)
+
+
+def add_missing_todo_columns(connection: Connection) -> None:
+    """
+    Add columns mapped on Todo (or ArchivedTodo) that an existing table lacks.
+
+    create_all never alters existing tables. Intended for conn.run_sync().
+
+    Args:
+        connection: Synchronous connection inside an open transaction
+    """
+    for table in (Todo.__table__, ArchivedTodo.__table__):
+        existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+
+
+def create_todo_indexes(connection: Connection) -> None:
+    """
+    Create any missing indexes on the todos table.
+
+    create_all only emits indexes together with a new table, so indexes added
+    after the table exists are created here, and indexes they replace are
+    dropped. Intended for conn.run_sync().
+
+    Args:
+        connection: Synchronous connection inside an open transaction
+    """
+    for name in _RETIRED_INDEXES:
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+    for index in Todo.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
+def _partitioned_todo_table():
+    """
+    Copy of the todos table definition, hash-partitioned on user_id.
+
+    PostgreSQL requires the partition key in every unique constraint, so the
+    primary key becomes (id, user_id). Ids are still unique UUIDs.
+
+    The copy lives in a fresh MetaData that also holds copies of the tables
+    its foreign keys reference (users), so the REFERENCES clauses compile.
+    """
+    metadata = MetaData()
+    for foreign_key in Todo.__table__.foreign_keys:
+        foreign_key.column.table.to_metadata(metadata)
+    table = Todo.__table__.to_metadata(metadata)
+    table.append_constraint(PrimaryKeyConstraint(table.c.id, table.c.user_id))
+    table.dialect_kwargs["postgresql_partition_by"] = "HASH (user_id)"
+    return table
+
+
+def create_partitioned_todos_table(connection: Connection, partitions: int) -> None:
+    """
+    Create the todos table hash-partitioned on user_id, if it doesn't exist.
+
+    Runs before create_all, which then leaves the existing table alone. Does
+    nothing unless partitions > 0 and the database is PostgreSQL; an existing
+    regular table is left as is (see convert_todos_to_partitioned).
+    Intended for conn.run_sync().
+
+    Args:
+        connection: Synchronous connection inside an open transaction
+        partitions: Number of hash partitions (0 disables partitioning)
+    """
+    if partitions <= 0 or connection.dialect.name != "postgresql":
+        return
+
+    name = Todo.__table__.name
+    if inspect(connection).has_table(name):
+        return
+
+    # Referenced tables (e.g. users) must exist before the foreign keys
+    for foreign_key in Todo.__table__.foreign_keys:
+        foreign_key.column.table.create(connection, checkfirst=True)
+
+    _partitioned_todo_table().create(connection)
+    for remainder in range(partitions):
+        connection.exec_driver_sql(
+            f"CREATE TABLE {name}_p{remainder} PARTITION OF {name} "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+
+
+def _copy_batch_statement(name: str, old_name: str, first_batch: bool) -> TextClause:
+    """
+    Build the statement that copies one keyset batch into the new table.
+
+    Uses bound :last_id and :limit parameters so it runs under any driver
+    paramstyle (asyncpg's numeric $n included).
+
+    Args:
+        name: Partitioned todos table
+        old_name: Renamed regular table being copied from
+        first_batch: True for the first batch, which has no :last_id
+
+    Returns:
+        INSERT ... SELECT ... RETURNING id statement
+    """
+    columns = ", ".join(column.name for column in Todo.__table__.columns)
+    where = "" if first_batch else "WHERE id > :last_id "
+    return text(
+        f"WITH batch AS (SELECT {columns} FROM {old_name} {where}"
+        f"ORDER BY id LIMIT :limit) "
+        f"INSERT INTO {name} ({columns}) SELECT {columns} FROM batch RETURNING id"
+    )
+
+
+def convert_todos_to_partitioned(
+    connection: Connection,
+    partitions: int,
+    batch_size: int = 10_000
+) -> int:
+    """
+    Migrate an existing regular todos table to a hash-partitioned one.
+
+    Meant for a maintenance window with writers stopped: the old table is
+    renamed, the partitioned table created, rows copied in keyset batches
+    with a commit after each, and the old table dropped. The next startup
+    (init_db) re-adds the full-text search column and any missing indexes.
+
+    Use a connection from engine.connect() (not engine.begin()) so each
+    batch commits on its own.
+
+    Args:
+        connection: Synchronous PostgreSQL connection
+        partitions: Number of hash partitions
+        batch_size: Rows copied per transaction
+
+    Returns:
+        Number of rows copied
+    """
+    name = Todo.__table__.name
+    old_name = f"{name}_unpartitioned"
+    inspector = inspect(connection)
+
+    # Index and constraint names are schema-wide; free them for the new table
+    for index in inspector.get_indexes(name):
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index['name']}")
+    primary_key = inspector.get_pk_constraint(name)["name"]
+    connection.exec_driver_sql(f"ALTER TABLE {name} RENAME TO {old_name}")
+    if primary_key:
+        connection.exec_driver_sql(
+            f"ALTER TABLE {old_name} RENAME CONSTRAINT {primary_key} TO {old_name}_pkey"
+        )
+    connection.commit()
+
+    create_partitioned_todos_table(connection, partitions)
+    connection.commit()
+
+    copied = 0
+    last_id = None
+    while True:
+        parameters = {"limit": batch_size}
+        if last_id is not None:
+            parameters["last_id"] = last_id
+        result = connection.execute(
+            _copy_batch_statement(name, old_name, first_batch=last_id is None),
+            parameters
+        )
+        ids = [row[0] for row in result]
+        connection.commit()
+        if not ids:
+            break
+        copied += len(ids)
+        last_id = max(ids)
+
+    connection.exec_driver_sql(f"DROP TABLE {old_name}")
+    connection.commit()
+    return copied
@@ -0,0 +1,23 @@
+"""
+Normalized todo tags for indexed tag filtering.
+"""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from uuid import UUID
+
+
+class TodoTag(SQLModel, table=True):
+    """
+    One tag on one todo.
+
+    The todo's own tags column holds the same list for responses; these rows
+    exist so tag filters are index lookups instead of scans of every todo.
+    """
+    __tablename__ = "todo_tags"
+    __table_args__ = (
+        Index("ix_todo_tags_user_tag_todo", "user_id", "tag", "todo_id"),
+    )
+
+    user_id: UUID = Field(primary_key=True, description="Owner of the todo")
+    todo_id: UUID = Field(primary_key=True, description="Tagged todo")
+    tag: str = Field(primary_key=True, max_length=50, description="Normalized tag")
@@ -0,0 +1,99 @@
+"""
+Todo tags: normalized tag rows and the per-user tag dictionary.
+
+Each todo's tags live twice: in its tags column, which responses read, and
+as todo_tags rows, which tag filters and the dictionary read through the
+(user_id, tag) index. The write paths in todo_service keep both in step.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+from sqlalchemy import delete, func, insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.todo import Todo
+from app.models.todo_tag import TodoTag
+from app.services.todo_queries import scope_to_user
+from app.services.todo_sync import get_todo_version
+
+
+# Users whose tag dictionaries are kept in memory
+MAX_CACHED_DICTIONARIES = 10_000
+
+# user_id -> (todo version the dictionary was built at, dictionary)
+_dictionaries: "OrderedDict[UUID, Tuple[int, List[Dict[str, Any]]]]" = OrderedDict()
+
+
+async def write_todo_tags(
+    session: AsyncSession,
+    user_id: UUID,
+    tags_by_todo: Dict[UUID, List[str]],
+    replace: bool = False
+) -> None:
+    """
+    Store the tag rows for todos.
+
+    Args:
+        session: Database session (same transaction as the todo write)
+        user_id: UUID of the owning user
+        tags_by_todo: Normalized tags for each todo
+        replace: Drop the todos' existing tag rows first
+    """
+    if not tags_by_todo:
+        return
+
+    if replace:
+        await session.execute(
+            delete(TodoTag)
+            .where(TodoTag.user_id == user_id)
+            .where(TodoTag.todo_id.in_(list(tags_by_todo)))
+            .execution_options(synchronize_session=False)
+        )
+
+    rows = [
+        {"user_id": user_id, "todo_id": todo_id, "tag": tag}
+        for todo_id, tags in tags_by_todo.items()
+        for tag in tags
+    ]
+    if rows:
+        await session.execute(insert(TodoTag), rows)
+
+
+async def get_tag_dictionary(session: AsyncSession, user_id: UUID) -> List[Dict[str, Any]]:
+    """
+    List a user's tags with the number of live todos carrying each.
+
+    Served from memory while the user's todo version is unchanged, so
+    repeated reads cost a single primary-key lookup.
+
+    Args:
+        session: Database session
+        user_id: UUID of the user
+
+    Returns:
+        List of {"tag", "count"} dicts, most used first
+    """
+    version = await get_todo_version(session, user_id)
+    cached = _dictionaries.get(user_id)
+    if cached is not None and cached[0] == version:
+        _dictionaries.move_to_end(user_id)
+        return cached[1]
+
+    count = func.count().label("count")
+    result = await session.execute(
+        scope_to_user(
+            select(TodoTag.tag, count)
+            .join(Todo, (Todo.user_id == TodoTag.user_id) & (Todo.id == TodoTag.todo_id)),
+            user_id
+        )
+        .where(TodoTag.user_id == user_id)
+        .group_by(TodoTag.tag)
+        .order_by(count.desc(), TodoTag.tag)
+    )
+    dictionary = [{"tag": row.tag, "count": row.count} for row in result.all()]
+
+    _dictionaries[user_id] = (version, dictionary)
+    _dictionaries.move_to_end(user_id)
+    while len(_dictionaries) > MAX_CACHED_DICTIONARIES:
+        _dictionaries.popitem(last=False)
+    return dictionary
@@ -7,6 +7,13 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.todo import Todo
+from app.services.todo_queries import apply_tag_filter, apply_todo_filters, scope_to_user
+from app.schemas.todo import TodoCreate, TodoUpdate, normalize_tags
+from app.services.todo_service import (
+    insert_todos,
+    update_todo_fields,
+    delete_todo_row,
+)
 
 
 # Tool Definitions (OpenAI function calling format)
@@ -26,6 +33,19 @@ CREATE_TODO_TOOL = {
                 "description": {
                     "type": "string",
                     "description": "Optional detailed description of the todo item"
+                },
+                "due_at": {
+                    "type": "string",
+                    "description": "When the todo is due, as an ISO 8601 date-time (e.g. 2025-03-01T17:00:00Z)"
+                },
+                "remind_at": {
+                    "type": "string",
+                    "description": "When to remind the user, as an ISO 8601 date-time"
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Tags/labels for the todo item, e.g. [\"work\", \"urgent\"]"
                 }
             },
             "required": ["title"]
@@ -37,13 +57,23 @@ LIST_TODOS_TOOL = {
     "type": "function",
     "function": {
         "name": "list_todos",
-        "description": "List all todo items for the user, optionally filtered by completion status",
+        "description": "List all todo items for the user, optionally filtered by completion status or tags",
         "parameters": {
             "type": "object",
             "properties": {
                 "completed": {
                     "type": "boolean",
                     "description": "Filter by completion status. If not provided, returns all todos."
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Only return todos with these tags"
+                },
+                "tag_match": {
+                    "type": "string",
+                    "enum": ["any", "all"],
+                    "description": "any: todos with at least one of the tags (default); all: todos with every tag"
                 }
             },
             "required": []
@@ -55,7 +85,7 @@ UPDATE_TODO_TOOL = {
     "type": "function",
     "function": {
         "name": "update_todo",
-        "description": "Update a todo item's title, description, or completion status",
+        "description": "Update a todo item's title, description, due date, reminder, tags, or completion status",
         "parameters": {
             "type": "object",
             "properties": {
@@ -74,6 +104,19 @@ UPDATE_TODO_TOOL = {
                 "completed": {
                     "type": "boolean",
                     "description": "New completion status"
+                },
+                "due_at": {
+                    "type": "string",
+                    "description": "When the todo is due, as an ISO 8601 date-time (e.g. 2025-03-01T17:00:00Z)"
+                },
+                "remind_at": {
+                    "type": "string",
+                    "description": "When to remind the user, as an ISO 8601 date-time"
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Tags/labels for the todo item, e.g. [\"work\", \"urgent\"]"
                 }
             },
             "required": ["todo_id"]
@@ -133,7 +176,10 @@ async def create_todo_handler(
     session: AsyncSession,
     user_id: UUID,
     title: str,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    due_at: Optional[str] = None,
+    remind_at: Optional[str] = None,
+    tags: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Handler for create_todo tool.
@@ -143,27 +189,36 @@ async def create_todo_handler(
         user_id: UUID of the user creating the todo
         title: Todo title
         description: Optional todo description
+        due_at: Optional ISO 8601 due date-time
+        remind_at: Optional ISO 8601 reminder date-time
+        tags: Optional tags
 
     Returns:
         Dict with success status and todo details
     """
     try:
-        todo = Todo(
-            user_id=user_id,
-            title=title,
-            description=description,
-            completed=False
+        [todo] = await insert_todos(
+            session,
+            user_id,
+            [TodoCreate(
+                title=title,
+                description=description,
+                due_at=due_at,
+                remind_at=remind_at,
+                tags=tags or []
+            )]
         )
-        session.add(todo)
         await session.commit()
-        await session.refresh(todo)
 
         return {
             "success": True,
-            "todo_id": str(todo.id),
-            "title": todo.title,
-            "description": todo.description,
-            "completed": todo.completed
+            "todo_id": str(todo["id"]),
+            "title": todo["title"],
+            "description": todo["description"],
+            "completed": todo["completed"],
+            "due_at": todo["due_at"].isoformat() if todo["due_at"] else None,
+            "remind_at": todo["remind_at"].isoformat() if todo["remind_at"] else None,
+            "tags": todo["tags"]
         }
     except Exception as e:
         return {
@@ -175,7 +230,9 @@ async def create_todo_handler(
 async def list_todos_handler(
     session: AsyncSession,
     user_id: UUID,
-    completed: Optional[bool] = None
+    completed: Optional[bool] = None,
+    tags: Optional[List[str]] = None,
+    tag_match: str = "any"
 ) -> Dict[str, Any]:
     """
     Handler for list_todos tool.
@@ -184,17 +241,21 @@ async def list_todos_handler(
         session: Database session
         user_id: UUID of the user
         completed: Optional filter by completion status
+        tags: Optional tags to filter by
+        tag_match: "any" or "all" of the tags
 
     Returns:
         Dict with success status and list of todos
     """
     try:
-        statement = select(Todo).where(Todo.user_id == user_id)
-
-        if completed is not None:
-            statement = statement.where(Todo.completed == completed)
-
-        statement = statement.order_by(Todo.created_at.desc())
+        statement = apply_todo_filters(
+            scope_to_user(select(Todo), user_id),
+            completed=completed
+        )
+        statement = apply_tag_filter(
+            statement, user_id, normalize_tags(tags) or [], "all" if tag_match == "all" else "any"
+        )
+        statement = statement.order_by(Todo.created_at.desc(), Todo.id.desc())
 
         result = await session.execute(statement)
         todos = result.scalars().all()
@@ -207,6 +268,8 @@ async def list_todos_handler(
                     "title": todo.title,
                     "description": todo.description,
                     "completed": todo.completed,
+                    "due_at": todo.due_at.isoformat() if todo.due_at else None,
+                    "tags": todo.tags,
                     "created_at": todo.created_at.isoformat()
                 }
                 for todo in todos
@@ -226,7 +289,10 @@ async def update_todo_handler(
     todo_id: str,
     title: Optional[str] = None,
     description: Optional[str] = None,
-    completed: Optional[bool] = None
+    completed: Optional[bool] = None,
+    due_at: Optional[str] = None,
+    remind_at: Optional[str] = None,
+    tags: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Handler for update_todo tool.
@@ -238,18 +304,31 @@ async def update_todo_handler(
         title: Optional new title
         description: Optional new description
         completed: Optional new completion status
+        due_at: Optional new ISO 8601 due date-time
+        remind_at: Optional new ISO 8601 reminder date-time
+        tags: Optional replacement tags
 
     Returns:
         Dict with success status and updated todo details
     """
     try:
         todo_uuid = UUID(todo_id)
-        statement = select(Todo).where(
-            Todo.id == todo_uuid,
-            Todo.user_id == user_id
-        )
-        result = await session.execute(statement)
-        todo = result.scalar_one_or_none()
+
+        # Update fields if provided
+        values = {}
+        if title is not None:
+            values["title"] = title
+        if description is not None:
+            values["description"] = description
+        if due_at is not None or remind_at is not None or tags is not None:
+            changes = TodoUpdate(due_at=due_at, remind_at=remind_at, tags=tags)
+            values.update(changes.model_dump(include={"due_at", "remind_at", "tags"}, exclude_none=True))
+
+        if completed is not None:
+            values["completed"] = completed
+
+        # One counter-aware UPDATE covers completion and the other fields
+        todo = await update_todo_fields(session, user_id, todo_uuid, values)
 
         if not todo:
             return {
@@ -257,29 +336,22 @@ async def update_todo_handler(
                 "error": "Todo not found or you don't have permission to update it"
             }
 
-        # Update fields if provided
-        if title is not None:
-            todo.title = title
-        if description is not None:
-            todo.description = description
-        if completed is not None:
-            todo.completed = completed
-
-        session.add(todo)
         await session.commit()
-        await session.refresh(todo)
 
         return {
             "success": True,
-            "todo_id": str(todo.id),
-            "title": todo.title,
-            "description": todo.description,
-            "completed": todo.completed
+            "todo_id": str(todo["id"]),
+            "title": todo["title"],
+            "description": todo["description"],
+            "completed": todo["completed"],
+            "due_at": todo["due_at"].isoformat() if todo["due_at"] else None,
+            "remind_at": todo["remind_at"].isoformat() if todo["remind_at"] else None,
+            "tags": todo["tags"]
         }
     except ValueError:
         return {
             "success": False,
-            "error": "Invalid todo ID format"
+            "error": "Invalid todo ID, date or tag"
         }
     except Exception as e:
         return {
@@ -306,25 +378,19 @@ async def delete_todo_handler(
     """
     try:
         todo_uuid = UUID(todo_id)
-        statement = select(Todo).where(
-            Todo.id == todo_uuid,
-            Todo.user_id == user_id
-        )
-        result = await session.execute(statement)
-        todo = result.scalar_one_or_none()
+        deleted = await delete_todo_row(session, user_id, todo_uuid)
 
-        if not todo:
+        if not deleted:
             return {
                 "success": False,
                 "error": "Todo not found or you don't have permission to delete it"
             }
 
-        await session.delete(todo)
         await session.commit()
 
         return {
             "success": True,
-            "message": f"Todo '{todo.title}' deleted successfully"
+            "message": f"Todo '{deleted['title']}' deleted successfully"
         }
     except ValueError:
         return {
@@ -356,10 +422,7 @@ async def get_todo_handler(
     """
     try:
         todo_uuid = UUID(todo_id)
-        statement = select(Todo).where(
-            Todo.id == todo_uuid,
-            Todo.user_id == user_id
-        )
+        statement = scope_to_user(select(Todo).where(Todo.id == todo_uuid), user_id)
         result = await session.execute(statement)
         todo = result.scalar_one_or_none()
 
@@ -376,6 +439,9 @@ async def get_todo_handler(
                 "title": todo.title,
                 "description": todo.description,
                 "completed": todo.completed,
+                "due_at": todo.due_at.isoformat() if todo.due_at else None,
+                "remind_at": todo.remind_at.isoformat() if todo.remind_at else None,
+                "tags": todo.tags,
                 "created_at": todo.created_at.isoformat(),
                 "updated_at": todo.updated_at.isoformat()
             }
@@ -1,36 +1,137 @@
 """
 Todo routes for CRUD operations.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
 from uuid import UUID
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from app.database import get_session
-from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse
+from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse, TodoBatchRequest, normalize_tags
 from app.models.todo import Todo
+from app.models.archived_todo import ArchivedTodo
 from app.models.user import User
 from app.auth.dependencies import get_current_user
 from app.utils.responses import success_response, error_response
+from app.utils.etag import make_etag, etag_matches, parse_if_match_version
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    encode_cursor,
+    decode_cursor,
+    page_info,
+)
+from app.services.todo_queries import (
+    SORT_COLUMNS,
+    SORT_ORDERS,
+    TAG_MATCHES,
+    apply_tag_filter,
+    apply_todo_filters,
+    apply_keyset_page,
+    split_page,
+    parse_fields,
+    select_todo_fields,
+    scope_to_user,
+    row_to_dict,
+)
+from app.services.todo_search import search_todos as run_todo_search
+from app.services.todo_sync import get_todo_version, list_todo_changes
+from app.services.todo_export import EXPORT_FORMATS, stream_todos_export
+from app.services.todo_import import IMPORT_FORMATS, import_todos
+from app.services.todo_stats import MAX_STATS_WINDOW_DAYS, get_todo_stats
+from app.services.todo_cache import get_todo_cache, todo_cache_key
+from app.services.todo_events import get_todo_event_hub
+from app.services.todo_tags import get_tag_dictionary
+from app.services.idempotency import (
+    IdempotencyError,
+    IdempotencyKeyInProgress,
+    request_fingerprint,
+    run_idempotent,
+)
+from app.services.todo_service import (
+    MAX_BATCH_OPERATIONS,
+    TodoVersionConflict,
+    insert_todos,
+    update_todo_fields,
+    toggle_todo_completed,
+    delete_todo_row,
+    set_todos_completed,
+    delete_todo_rows,
+)
 
 
 router = APIRouter()
 
+# Idle seconds before an event stream sends a keep-alive comment
+EVENT_HEARTBEAT_SECONDS = 15
+
+
+def _expected_version(if_match: Optional[str]) -> Optional[int]:
+    """
+    Parse an If-Match header into the todo version the client last saw.
+
+    Raises:
+        HTTPException: 400 if the header doesn't carry a version number
+    """
+    try:
+        return parse_if_match_version(if_match)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message='If-Match must be the todo\'s "version" field, e.g. "3", or *'
+            )
+        )
+
+
+def _precondition_failed(conflict: TodoVersionConflict) -> HTTPException:
+    """Build the 412 response for a stale If-Match version."""
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=error_response(
+            code="PRECONDITION_FAILED",
+            message=f"Todo was modified by another client (current version {conflict.current_version})"
+        )
+    )
+
+
+def _idempotency_failed(error: IdempotencyError) -> HTTPException:
+    """Build the 409/422 response for an Idempotency-Key that can't be used."""
+    return HTTPException(
+        status_code=(
+            status.HTTP_409_CONFLICT
+            if isinstance(error, IdempotencyKeyInProgress)
+            else status.HTTP_422_UNPROCESSABLE_ENTITY
+        ),
+        detail=error_response(code=error.code, message=str(error))
+    )
+
 
 @router.post("/users/{user_id}/todos", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def create_todo(
     user_id: UUID,
     todo_data: TodoCreate,
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Create a new todo item for the authenticated user.
 
+    With an Idempotency-Key header, retries of the same request return the
+    first response instead of creating another todo.
+
     Args:
         user_id: User ID from URL path (must match authenticated user)
         todo_data: Todo creation data (title and optional description)
+        request: Incoming request (path used to fingerprint idempotent calls)
+        idempotency_key: Optional Idempotency-Key header
         current_user: Authenticated user from JWT token
         session: Database session
 
@@ -39,6 +140,8 @@ async def create_todo(
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 409 if a request with the same Idempotency-Key is in progress
+        HTTPException: 422 if the Idempotency-Key was used for a different request
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -50,45 +153,180 @@ async def create_todo(
             )
         )
 
-    # Create new todo
-    new_todo = Todo(
-        user_id=current_user.id,
-        title=todo_data.title,
-        description=todo_data.description
-    )
+    async def create() -> JSONResponse:
+        # Create new todo (single INSERT ... RETURNING)
+        [new_todo] = await insert_todos(session, current_user.id, [todo_data])
+        await session.commit()
 
-    session.add(new_todo)
-    await session.commit()
-    await session.refresh(new_todo)
+        return JSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=jsonable_encoder(success_response(
+                data=new_todo,
+                message="Todo created successfully"
+            ))
+        )
+
+    if idempotency_key is None:
+        return await create()
+
+    fingerprint = request_fingerprint("POST", request.url.path, todo_data.model_dump_json())
+    try:
+        return await run_idempotent(current_user.id, idempotency_key, fingerprint, create)
+    except IdempotencyError as e:
+        raise _idempotency_failed(e)
+
+
+@router.post("/users/{user_id}/todos:batch", response_model=dict)
+async def batch_todos(
+    user_id: UUID,
+    batch: TodoBatchRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Apply many todo operations in a single transaction.
+
+    Operations run in order: create, update, complete, delete. Creates are one
+    multi-row INSERT, completion changes and deletes are one statement per
+    group. IDs that don't exist or belong to another user are reported in
+    not_found instead of failing the batch, so offline queues can be replayed.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        batch: Lists of create, update, complete and delete operations
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with the results of each operation group
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if the batch has too many operations
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only modify your own todos"
+            )
+        )
+
+    total = len(batch.create) + len(batch.update) + len(batch.complete) + len(batch.delete)
+    if total > MAX_BATCH_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"A batch can contain at most {MAX_BATCH_OPERATIONS} operations"
+            )
+        )
 
-    # Convert to response model
-    todo_response = TodoResponse.model_validate(new_todo)
+    not_found = []
+
+    created = await insert_todos(session, current_user.id, batch.create)
+
+    updated = []
+    for item in batch.update:
+        values = item.model_dump(include={"title", "description"}, exclude_none=True)
+        values.update(item.model_dump(include={"due_at", "remind_at"}, exclude_unset=True))
+        if item.tags is not None:
+            values["tags"] = item.tags
+        todo = await update_todo_fields(session, current_user.id, item.id, values)
+        if todo is None:
+            not_found.append(item.id)
+        else:
+            updated.append(todo)
+
+    # One UPDATE per target status instead of one per todo
+    completed = []
+    for status_value in (True, False):
+        ids = [item.id for item in batch.complete if item.completed is status_value]
+        changed = await set_todos_completed(session, current_user.id, ids, status_value)
+        changed_ids = {todo["id"] for todo in changed}
+        not_found.extend(todo_id for todo_id in ids if todo_id not in changed_ids)
+        completed.extend(changed)
+
+    deleted = await delete_todo_rows(session, current_user.id, batch.delete)
+    deleted_ids = set(deleted)
+    not_found.extend(todo_id for todo_id in batch.delete if todo_id not in deleted_ids)
+
+    await session.commit()
 
     return success_response(
-        data=todo_response.model_dump(),
-        message="Todo created successfully"
+        data={
+            "created": created,
+            "updated": updated,
+            "completed": completed,
+            "deleted": deleted,
+            "not_found": not_found
+        },
+        message="Batch applied successfully"
     )
 
 
 @router.get("/users/{user_id}/todos", response_model=dict)
 async def list_todos(
     user_id: UUID,
+    request: Request,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    tags: Optional[str] = None,
+    tag_match: str = "any",
+    sort_by: str = "created_at",
+    order: str = "desc",
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
-    List all todos for the authenticated user.
+    List todos for the authenticated user, one page at a time.
+
+    Filtering and sorting run in SQL. Pages are keyset-paginated on the sort
+    key and id: pass the next_cursor from the previous response, together
+    with the same filters and sort, to fetch the following page.
+
+    Responses carry a weak ETag derived from the user's todo version; a
+    matching If-None-Match is answered with 304 without loading any rows,
+    and serialized pages are served from the read cache until the next write.
+
+    Only the hot set is listed: completed todos older than the archive
+    threshold are served by /todos/archive.
 
     Args:
         user_id: User ID from URL path (must match authenticated user)
+        request: Incoming request (path and query string shape the ETag)
+        limit: Maximum number of todos to return (1-200)
+        cursor: Opaque cursor from a previous page (optional)
+        completed: Filter by completion status (optional)
+        created_after: Only todos created at or after this time (optional)
+        created_before: Only todos created before this time (optional)
+        updated_after: Only todos updated at or after this time (optional)
+        updated_before: Only todos updated before this time (optional)
+        tags: Comma-separated tags to filter by (optional)
+        tag_match: any (todos with at least one tag) or all (todos with every tag)
+        sort_by: Sort key - created_at, updated_at or title
+        order: Sort order - asc or desc
+        fields: Comma-separated fields to return, e.g. id,title,completed (optional)
+        if_none_match: ETag from the client's cached copy (optional)
         current_user: Authenticated user from JWT token
         session: Database session
 
     Returns:
-        Success response with list of todos
+        Success response with a page of todos and pagination info,
+        or 304 Not Modified
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if limit, sort, tags, fields or cursor is invalid
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -100,17 +338,172 @@ async def list_todos(
             )
         )
 
-    # Query todos filtered by authenticated user_id
-    result = await session.execute(
-        select(Todo)
-        .where(Todo.user_id == current_user.id)
-        .order_by(Todo.created_at.desc())
+    try:
+        tag_filter = normalize_tags(tags) or []
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=str(e)
+            )
+        )
+
+    if tag_match not in TAG_MATCHES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"tag_match must be one of {', '.join(TAG_MATCHES)}"
+            )
+        )
+
+    # Validate pagination and sort parameters
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"Limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        )
+
+    if sort_by not in SORT_COLUMNS or order not in SORT_ORDERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=(
+                    f"sort_by must be one of {', '.join(SORT_COLUMNS)} "
+                    f"and order must be one of {', '.join(SORT_ORDERS)}"
+                )
+            )
+        )
+
+    try:
+        field_names = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=str(e)
+            )
+        )
+
+    # Conditional GET: a single index probe decides whether anything changed
+    version = await get_todo_version(session, current_user.id)
+    etag = make_etag(current_user.id, version, f"{request.url.path}?{request.url.query}")
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    # Serve the serialized payload from cache when this version was read before
+    cache = get_todo_cache()
+    cache_key = todo_cache_key(current_user.id, etag)
+    cached = await cache.get(current_user.id, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+
+    # Query only the requested columns of todos owned by the authenticated user.
+    # The sort key is always loaded so the next cursor can be built.
+    statement = apply_todo_filters(
+        scope_to_user(select_todo_fields(field_names, sort_by), current_user.id),
+        completed=completed,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before
+    )
+    statement = apply_tag_filter(statement, current_user.id, tag_filter, tag_match)
+
+    try:
+        statement = apply_keyset_page(statement, sort_by, order, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message="Invalid pagination cursor"
+            )
+        )
+
+    result = await session.execute(statement)
+    rows, next_cursor = split_page(result.all(), sort_by, order, limit)
+
+    # Build response dicts straight from the result tuples
+    todo_data = [row_to_dict(row, field_names) for row in rows]
+
+    payload = success_response(
+        data=todo_data,
+        message="Todos retrieved successfully"
     )
-    todos = result.scalars().all()
+    payload["pagination"] = page_info(limit, next_cursor)
+
+    response = JSONResponse(content=jsonable_encoder(payload), headers={"ETag": etag})
+    await cache.set(current_user.id, cache_key, response.body)
+    return response
 
-    # Convert to response models
-    todo_responses = [TodoResponse.model_validate(todo) for todo in todos]
-    todo_data = [todo.model_dump() for todo in todo_responses]
+
+@router.get("/users/{user_id}/todos/search", response_model=dict)
+async def search_todos(
+    user_id: UUID,
+    q: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Full-text search over the authenticated user's todo titles and descriptions.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        q: Search text
+        limit: Maximum number of matches to return (1-200)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with matching todos, best match first
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if the query is empty or limit is invalid
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only search your own todos"
+            )
+        )
+
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message="Search query must not be empty"
+            )
+        )
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"Limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        )
+
+    matches = await run_todo_search(session, current_user.id, q.strip(), limit)
+
+    # Convert to response models, keeping the relevance score
+    todo_data = [
+        {**TodoResponse.model_validate(todo).model_dump(), "rank": rank}
+        for todo, rank in matches
+    ]
 
     return success_response(
         data=todo_data,
@@ -118,28 +511,507 @@ async def list_todos(
     )
 
 
+@router.get("/users/{user_id}/todos/changes", response_model=dict)
+async def list_todo_changes_since(
+    user_id: UUID,
+    since: Optional[str] = None,
+    limit: int = MAX_PAGE_SIZE,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Delta-sync feed: todos created, updated or deleted after a cursor.
+
+    Without since, returns no changes and a cursor for the current state.
+    Clients fetch that cursor first, load their snapshot with list_todos,
+    then poll this endpoint with the latest cursor. Replaying a change that
+    is already in the snapshot is harmless.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        since: Cursor from a previous call (optional)
+        limit: Maximum number of changes to return (1-200)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with changed todos, deleted todo ids and the next cursor
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if limit or cursor is invalid
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only access your own todos"
+            )
+        )
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"Limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        )
+
+    if since is None:
+        version = await get_todo_version(session, current_user.id)
+        return success_response(
+            data={
+                "changed": [],
+                "deleted": [],
+                "next_cursor": encode_cursor({"seq": version}),
+                "has_more": False
+            },
+            message="Sync cursor created successfully"
+        )
+
+    try:
+        since_seq = int(decode_cursor(since)["seq"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message="Invalid sync cursor"
+            )
+        )
+
+    changed, deleted, last_seq, has_more = await list_todo_changes(
+        session, current_user.id, since_seq, limit
+    )
+
+    return success_response(
+        data={
+            "changed": changed,
+            "deleted": deleted,
+            "next_cursor": encode_cursor({"seq": last_seq}),
+            "has_more": has_more
+        },
+        message="Todo changes retrieved successfully"
+    )
+
+
+@router.get("/users/{user_id}/todos/export")
+async def export_todos(
+    user_id: UUID,
+    format: str = "ndjson",
+    fields: Optional[str] = None,
+    completed: Optional[bool] = None,
+    include_archived: bool = True,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream all of the authenticated user's todos as NDJSON or CSV.
+
+    Rows flow from a server-side cursor straight into the response body,
+    so exports of any size use constant worker memory. Archived todos are
+    included after the live ones unless include_archived=false.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        format: Export format - ndjson or csv
+        fields: Comma-separated fields to export (optional)
+        completed: Filter by completion status (optional)
+        include_archived: Also export archived todos (default true)
+        current_user: Authenticated user from JWT token
+
+    Returns:
+        Streaming response with one todo per line
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if format or fields is invalid
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only export your own todos"
+            )
+        )
+
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"format must be one of {', '.join(EXPORT_FORMATS)}"
+            )
+        )
+
+    try:
+        field_names = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=str(e)
+            )
+        )
+
+    return StreamingResponse(
+        stream_todos_export(
+            current_user.id, format, field_names,
+            completed=completed, include_archived=include_archived
+        ),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="todos.{format}"'}
+    )
+
+
+@router.post("/users/{user_id}/todos/import", response_model=dict)
+async def import_todos_stream(
+    user_id: UUID,
+    request: Request,
+    format: str = "ndjson",
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Bulk-import todos from a streamed NDJSON or CSV request body.
+
+    NDJSON bodies hold one {"title", "description"} object per line; CSV
+    bodies start with a header row naming those columns. Rows are validated
+    with the same rules as create_todo and loaded in committed chunks.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        request: Incoming request whose body is streamed
+        format: Body format - ndjson or csv
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with imported and failed counts and per-row errors
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if format is invalid
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only import todos for yourself"
+            )
+        )
+
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"format must be one of {', '.join(IMPORT_FORMATS)}"
+            )
+        )
+
+    summary = await import_todos(session, current_user.id, request.stream(), format)
+
+    return success_response(
+        data=summary,
+        message="Todos imported successfully"
+    )
+
+
+@router.get("/users/{user_id}/todos/stats", response_model=dict)
+async def todo_stats(
+    user_id: UUID,
+    days: int = 7,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Get todo counts for the authenticated user.
+
+    Counts come from per-user counters kept current by every write, so this
+    never scans the todos table.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        days: Window for the created_recently count (1-90)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with total, open, completed and created_recently counts
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if days is out of range
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only access your own todos"
+            )
+        )
+
+    if days < 1 or days > MAX_STATS_WINDOW_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"Days must be between 1 and {MAX_STATS_WINDOW_DAYS}"
+            )
+        )
+
+    stats = await get_todo_stats(session, current_user.id, days)
+    # Keep the counters if this read seeded them
+    await session.commit()
+
+    return success_response(
+        data=stats,
+        message="Todo statistics retrieved successfully"
+    )
+
+
+@router.get("/users/{user_id}/todos/events")
+async def stream_todo_events(
+    user_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Push the authenticated user's todo changes as Server-Sent Events.
+
+    Replaces polling list_todos: each write (REST or chat agent) sends a
+    "changed" or "deleted" event carrying the affected ids and the
+    delta-sync cursor after the write. Clients fetch the changes with
+    /todos/changes using their previous cursor. A "reminder" event is sent
+    when a todo's remind_at time arrives. A "resync" event means events
+    were dropped and the client should catch up from its cursor.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        request: Incoming request (used to detect disconnects)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        text/event-stream response that stays open until the client leaves
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only subscribe to your own todos"
+            )
+        )
+
+    # The stream never touches the database; give the connection back now
+    await session.close()
+
+    hub = get_todo_event_hub()
+    queue = hub.subscribe(current_user.id)
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                event_id = f"id: {payload['version']}\n" if "version" in payload else ""
+                yield f"{event_id}event: {payload['type']}\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            hub.unsubscribe(current_user.id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/users/{user_id}/todos/archive", response_model=dict)
+async def list_archived_todos(
+    user_id: UUID,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    List the authenticated user's archived todos, one page at a time.
+
+    Archived todos are completed todos moved out of the hot table by the
+    archive job. Pagination works like list_todos.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        limit: Maximum number of todos to return (1-200)
+        cursor: Opaque cursor from a previous page (optional)
+        sort_by: Sort key - created_at, updated_at or title
+        order: Sort order - asc or desc
+        fields: Comma-separated fields to return (optional)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with a page of archived todos and pagination info
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+        HTTPException: 400 if limit, sort, fields or cursor is invalid
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only access your own todos"
+            )
+        )
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=f"Limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        )
+
+    if sort_by not in SORT_COLUMNS or order not in SORT_ORDERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=(
+                    f"sort_by must be one of {', '.join(SORT_COLUMNS)} "
+                    f"and order must be one of {', '.join(SORT_ORDERS)}"
+                )
+            )
+        )
+
+    try:
+        field_names = parse_fields(fields)
+        statement = apply_keyset_page(
+            select_todo_fields(field_names, sort_by, model=ArchivedTodo)
+            .where(ArchivedTodo.user_id == current_user.id),
+            sort_by,
+            order,
+            limit,
+            cursor,
+            model=ArchivedTodo
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=str(e)
+            )
+        )
+
+    result = await session.execute(statement)
+    rows, next_cursor = split_page(result.all(), sort_by, order, limit)
+
+    payload = success_response(
+        data=[row_to_dict(row, field_names) for row in rows],
+        message="Archived todos retrieved successfully"
+    )
+    payload["pagination"] = page_info(limit, next_cursor)
+    return payload
+
+
+@router.get("/users/{user_id}/todos/tags", response_model=dict)
+async def list_todo_tags(
+    user_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    List the tags used on the authenticated user's todos.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        current_user: Authenticated user from JWT token
+        session: Database session
+
+    Returns:
+        Success response with each tag and its number of todos, most used first
+
+    Raises:
+        HTTPException: 403 if user_id doesn't match authenticated user
+    """
+    # Verify user_id in path matches authenticated user
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error_response(
+                code="FORBIDDEN",
+                message="You can only access your own todos"
+            )
+        )
+
+    return success_response(
+        data=await get_tag_dictionary(session, current_user.id),
+        message="Tags retrieved successfully"
+    )
+
+
 @router.get("/users/{user_id}/todos/{id}", response_model=dict)
 async def get_todo(
     user_id: UUID,
     id: UUID,
+    request: Request,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Get a specific todo by ID.
 
+    Supports conditional GET with a weak ETag derived from the user's todo
+    version; a matching If-None-Match is answered with 304. Serialized
+    responses are served from the read cache until the next write.
+
     Args:
         user_id: User ID from URL path (must match authenticated user)
         id: Todo ID
+        request: Incoming request (path and query string shape the ETag)
+        fields: Comma-separated fields to return (optional)
+        if_none_match: ETag from the client's cached copy (optional)
         current_user: Authenticated user from JWT token
         session: Database session
 
     Returns:
-        Success response with todo data
+        Success response with todo data, or 304 Not Modified
 
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user
         HTTPException: 404 if todo not found or doesn't belong to user
+        HTTPException: 400 if fields contains an unknown field
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -151,15 +1023,41 @@ async def get_todo(
             )
         )
 
-    # Query todo with ownership verification
+    try:
+        field_names = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_response(
+                code="INVALID_INPUT",
+                message=str(e)
+            )
+        )
+
+    # Conditional GET: a single index probe decides whether anything changed
+    version = await get_todo_version(session, current_user.id)
+    etag = make_etag(current_user.id, version, f"{request.url.path}?{request.url.query}")
+    # "*" is only answered once the todo is known to exist
+    if etag_matches(if_none_match, etag, match_any=False):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    # Serve the serialized payload from cache when this version was read before
+    # (only found todos are cached)
+    cache = get_todo_cache()
+    cache_key = todo_cache_key(current_user.id, etag)
+    cached = await cache.get(current_user.id, cache_key)
+    if cached is not None:
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+
+    # Query requested columns with ownership verification
     result = await session.execute(
-        select(Todo)
-        .where(Todo.id == id)
-        .where(Todo.user_id == current_user.id)
+        scope_to_user(select_todo_fields(field_names).where(Todo.id == id), current_user.id)
     )
-    todo = result.scalar_one_or_none()
+    row = result.first()
 
-    if todo is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=error_response(
@@ -168,30 +1066,39 @@ async def get_todo(
             )
         )
 
-    # Convert to response model
-    todo_response = TodoResponse.model_validate(todo)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    return success_response(
-        data=todo_response.model_dump(),
+    payload = success_response(
+        data=row_to_dict(row, field_names),
         message="Todo retrieved successfully"
     )
 
+    response = JSONResponse(content=jsonable_encoder(payload), headers={"ETag": etag})
+    await cache.set(current_user.id, cache_key, response.body)
+    return response
+
 
 @router.put("/users/{user_id}/todos/{id}", response_model=dict)
 async def update_todo(
     user_id: UUID,
     id: UUID,
     todo_data: TodoUpdate,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Update a todo item (title and/or description).
 
+    Send If-Match with the todo's version to update only if nobody else
+    changed it since; a stale version is rejected with 412.
+
     Args:
         user_id: User ID from URL path (must match authenticated user)
         id: Todo ID
         todo_data: Todo update data (title and/or description)
+        if_match: Todo "version" field the client last saw, or * (optional)
         current_user: Authenticated user from JWT token
         session: Database session
 
@@ -201,6 +1108,7 @@ async def update_todo(
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user or user doesn't own todo
         HTTPException: 404 if todo not found
+        HTTPException: 412 if If-Match doesn't match the todo's version
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -212,13 +1120,26 @@ async def update_todo(
             )
         )
 
-    # Query todo with ownership verification
-    result = await session.execute(
-        select(Todo)
-        .where(Todo.id == id)
-        .where(Todo.user_id == current_user.id)
-    )
-    todo = result.scalar_one_or_none()
+    # Update fields if provided
+    values = {}
+    if todo_data.title is not None:
+        values["title"] = todo_data.title
+    if todo_data.description is not None:
+        values["description"] = todo_data.description
+    # Dates can be cleared with an explicit null
+    values.update(todo_data.model_dump(include={"due_at", "remind_at"}, exclude_unset=True))
+    if todo_data.tags is not None:
+        values["tags"] = todo_data.tags
+
+    expected_version = _expected_version(if_match)
+
+    # Single UPDATE ... RETURNING with ownership (and version) verification
+    try:
+        todo = await update_todo_fields(
+            session, current_user.id, id, values, expected_version=expected_version
+        )
+    except TodoVersionConflict as conflict:
+        raise _precondition_failed(conflict)
 
     if todo is None:
         raise HTTPException(
@@ -229,23 +1150,10 @@ async def update_todo(
             )
         )
 
-    # Update fields if provided
-    if todo_data.title is not None:
-        todo.title = todo_data.title
-    if todo_data.description is not None:
-        todo.description = todo_data.description
-
-    # Update timestamp
-    todo.updated_at = datetime.utcnow()
-
     await session.commit()
-    await session.refresh(todo)
-
-    # Convert to response model
-    todo_response = TodoResponse.model_validate(todo)
 
     return success_response(
-        data=todo_response.model_dump(),
+        data=todo,
         message="Todo updated successfully"
     )
 
@@ -254,15 +1162,19 @@ async def update_todo(
 async def toggle_todo_completion(
     user_id: UUID,
     id: UUID,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Toggle todo completion status.
 
+    Honors If-Match with the todo's version like update_todo.
+
     Args:
         user_id: User ID from URL path (must match authenticated user)
         id: Todo ID
+        if_match: Todo "version" field the client last saw, or * (optional)
         current_user: Authenticated user from JWT token
         session: Database session
 
@@ -272,6 +1184,7 @@ async def toggle_todo_completion(
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user or user doesn't own todo
         HTTPException: 404 if todo not found
+        HTTPException: 412 if If-Match doesn't match the todo's version
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -283,13 +1196,15 @@ async def toggle_todo_completion(
             )
         )
 
-    # Query todo with ownership verification
-    result = await session.execute(
-        select(Todo)
-        .where(Todo.id == id)
-        .where(Todo.user_id == current_user.id)
-    )
-    todo = result.scalar_one_or_none()
+    expected_version = _expected_version(if_match)
+
+    # Toggle completion status atomically (completed = NOT completed)
+    try:
+        todo = await toggle_todo_completed(
+            session, current_user.id, id, expected_version=expected_version
+        )
+    except TodoVersionConflict as conflict:
+        raise _precondition_failed(conflict)
 
     if todo is None:
         raise HTTPException(
@@ -300,18 +1215,10 @@ async def toggle_todo_completion(
             )
         )
 
-    # Toggle completion status
-    todo.completed = not todo.completed
-    todo.updated_at = datetime.utcnow()
-
     await session.commit()
-    await session.refresh(todo)
-
-    # Convert to response model
-    todo_response = TodoResponse.model_validate(todo)
 
     return success_response(
-        data=todo_response.model_dump(),
+        data=todo,
         message="Todo completion status updated"
     )
 
@@ -320,15 +1227,21 @@ async def toggle_todo_completion(
 async def delete_todo(
     user_id: UUID,
     id: UUID,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Delete a todo item.
 
+    The todo is soft-deleted: it disappears from every read immediately and
+    is removed from the table later by the background purge job.
+    Honors If-Match with the todo's version like update_todo.
+
     Args:
         user_id: User ID from URL path (must match authenticated user)
         id: Todo ID
+        if_match: Todo "version" field the client last saw, or * (optional)
         current_user: Authenticated user from JWT token
         session: Database session
 
@@ -338,6 +1251,7 @@ async def delete_todo(
     Raises:
         HTTPException: 403 if user_id doesn't match authenticated user or user doesn't own todo
         HTTPException: 404 if todo not found
+        HTTPException: 412 if If-Match doesn't match the todo's version
     """
     # Verify user_id in path matches authenticated user
     if current_user.id != user_id:
@@ -349,15 +1263,17 @@ async def delete_todo(
             )
         )
 
-    # Query todo with ownership verification
-    result = await session.execute(
-        select(Todo)
-        .where(Todo.id == id)
-        .where(Todo.user_id == current_user.id)
-    )
-    todo = result.scalar_one_or_none()
+    expected_version = _expected_version(if_match)
 
-    if todo is None:
+    # Delete todo with ownership (and version) verification (DELETE ... RETURNING)
+    try:
+        deleted = await delete_todo_row(
+            session, current_user.id, id, expected_version=expected_version
+        )
+    except TodoVersionConflict as conflict:
+        raise _precondition_failed(conflict)
+
+    if deleted is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=error_response(
@@ -366,8 +1282,6 @@ async def delete_todo(
             )
         )
 
-    # Delete todo
-    await session.delete(todo)
     await session.commit()
 
     return success_response(
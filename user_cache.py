@@ -0,0 +1,106 @@
+"""
+In-process cache of authenticated users for get_current_user.
+
+Entries are the user's column values, kept for AUTH_USER_CACHE_TTL_SECONDS
+in an LRU bounded by AUTH_USER_CACHE_MAX_ENTRIES. ORM updates and deletes
+of a User drop its entry when flushed and again after commit, so a request
+racing the write cannot re-cache the old row. Writes made outside the ORM
+(Core UPDATE/DELETE, other services) must call invalidate_cached_user();
+otherwise other workers see the change within the TTL.
+"""
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.config import get_settings
+from app.models.user import User
+
+
+_INVALIDATED_USERS_KEY = "invalidated_user_ids"
+
+
+class UserCache:
+    """TTL + LRU cache of user rows keyed by user id."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: UUID) -> Optional[User]:
+        """
+        Return a fresh, session-less User built from the cached row.
+
+        Each call gets its own instance, so requests never share ORM state.
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        values, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return User(**values)
+
+    def set(self, user: User) -> None:
+        """Cache a user loaded from the database."""
+        if self.max_entries <= 0:
+            return
+        self._entries[user.id] = (user.model_dump(), time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a user's entry."""
+        self._entries.pop(user_id, None)
+
+
+@lru_cache()
+def get_user_cache() -> UserCache:
+    """
+    Get this worker's user cache (created once per process).
+    """
+    settings = get_settings()
+    return UserCache(settings.AUTH_USER_CACHE_MAX_ENTRIES, settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """
+    Drop a user from this worker's cache after updating or deleting them.
+
+    Args:
+        user_id: UUID of the changed user
+    """
+    get_user_cache().invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    invalidate_cached_user(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_INVALIDATED_USERS_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_INVALIDATED_USERS_KEY, ()):
+        invalidate_cached_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidated_users(session: Session) -> None:
+    session.info.pop(_INVALIDATED_USERS_KEY, None)
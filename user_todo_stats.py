@@ -0,0 +1,31 @@
+"""
+Incrementally maintained per-user todo counters.
+"""
+from sqlmodel import SQLModel, Field
+from datetime import date, datetime
+from uuid import UUID
+
+
+class UserTodoStats(SQLModel, table=True):
+    """
+    Running todo totals for one user.
+
+    Updated in the same transaction as every todo write, so reads never
+    have to count rows in the todos table.
+    """
+    __tablename__ = "user_todo_stats"
+
+    user_id: UUID = Field(primary_key=True, description="Owner of the todos")
+    total_count: int = Field(default=0, description="All todos")
+    open_count: int = Field(default=0, description="Todos not yet completed")
+    completed_count: int = Field(default=0, description="Completed todos")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class UserTodoDailyStats(SQLModel, table=True):
+    """Number of todos a user created on a given (UTC) day."""
+    __tablename__ = "user_todo_daily_stats"
+
+    user_id: UUID = Field(primary_key=True, description="Owner of the todos")
+    day: date = Field(primary_key=True, description="UTC calendar day")
+    created_count: int = Field(default=0, description="Todos created that day")
@@ -6,7 +6,7 @@ import re
 from typing import Optional
 from sqlmodel import Session, select
 from ..models.user import User
-from .password import verify_password
+from .password import verify_and_rehash, verify_and_rehash_async
 
 
 def is_valid_email(email: str) -> bool:
@@ -89,11 +89,55 @@ def authenticate_user(session: Session, email: str, password: str) -> Optional[U
     Returns:
         User object if credentials are valid, None otherwise
     """
-    user = get_user_by_email(session, email)
+    user = get_user_by_email_sync(session, email)
+    if not user:
+        return None
+
+    matches, new_hash = verify_and_rehash(password, user.password_hash)
+    if not matches:
+        return None
+
+    if new_hash is not None:
+        # Stored hash predates the current algorithm/cost settings
+        user.password_hash = new_hash
+        session.add(user)
+        session.commit()
+
+    return user
+
+
+async def authenticate_user_async(async_session, email: str, password: str) -> Optional[User]:
+    """
+    Authenticates a user by verifying their email and password - asynchronous version.
+
+    The password check, and the rehash of a hash made with outdated
+    settings, run on the password hashing pool, not the event loop.
+
+    Args:
+        async_session: Async database session
+        email: User's email address
+        password: User's password (plain text - will be hashed and compared)
 
-    if not user or not verify_password(password, user.password_hash):
+    Returns:
+        User object if credentials are valid, None otherwise
+
+    Raises:
+        PasswordHasherBusy: If the password hashing queue is full
+    """
+    user = await get_user_by_email_async(async_session, email)
+    if not user:
         return None
 
+    matches, new_hash = await verify_and_rehash_async(password, user.password_hash)
+    if not matches:
+        return None
+
+    if new_hash is not None:
+        # Stored hash predates the current algorithm/cost settings
+        user.password_hash = new_hash
+        async_session.add(user)
+        await async_session.commit()
+
     return user
 
 